@@ -7,11 +7,21 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import HomevoltApiClient
-from .const import CONF_SCAN_INTERVAL, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL
-from .coordinator import HomevoltCoordinator
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    STALE_TTL_CYCLES,
+    STORAGE_VERSION,
+)
+from .coordinator import HomevoltCoordinator, adaptive_max_interval
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,19 +33,33 @@ HomevoltConfigEntry = ConfigEntry
 
 async def async_setup_entry(hass: HomeAssistant, entry: HomevoltConfigEntry) -> bool:
     """Set up Homevolt from a config entry."""
-    session = async_get_clientsession(hass)
+    # Dedicated keep-alive session, closed by Home Assistant on unload and stop
+    session = async_create_clientsession(hass)
+
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    adaptive_polling = entry.options.get(
+        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+    )
+    # Stale data is served for a number of poll cycles; with adaptive polling
+    # a cycle can stretch up to the maximum back-off interval
+    longest_interval = scan_interval
+    if adaptive_polling:
+        longest_interval = adaptive_max_interval(scan_interval)
 
     client = HomevoltApiClient(
         session=session,
         host=entry.data[CONF_HOST],
         port=entry.data.get(CONF_PORT, DEFAULT_PORT),
         password=entry.data.get(CONF_PASSWORD),
+        stale_ttl=longest_interval * STALE_TTL_CYCLES,
     )
 
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    coordinator = HomevoltCoordinator(hass, entry, client, scan_interval)
+    coordinator = HomevoltCoordinator(
+        hass, entry, client, scan_interval, adaptive_polling
+    )
 
     # First refresh - raises ConfigEntryNotReady on failure
+    await coordinator.async_restore()
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
@@ -56,3 +80,8 @@ async def _async_update_options(hass: HomeAssistant, entry: HomevoltConfigEntry)
 async def async_unload_entry(hass: HomeAssistant, entry: HomevoltConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: HomevoltConfigEntry) -> None:
+    """Remove the data persisted for a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import replace
 import logging
-from typing import Any
+import random
+from time import monotonic
+from typing import Any, Final
 
 import aiohttp
+import orjson
 
 from .const import (
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_READ_TIMEOUT,
+    ENDPOINT_CONSOLE,
     ENDPOINT_EMS,
     ENDPOINT_ERROR_REPORT,
     ENDPOINT_NODE_METRICS,
     ENDPOINT_NODES,
+    ENDPOINT_PARAMS,
     ENDPOINT_SCHEDULE,
     ENDPOINT_STATUS,
 )
@@ -29,9 +36,89 @@ from .models import (
 
 _LOGGER = logging.getLogger(__name__)
 
-RETRY_STATUS_CODES = {502, 503, 504}
-MAX_RETRIES = 3
-BACKOFF_BASE = 2  # seconds
+# Decode response bodies with orjson, which ships with Home Assistant
+_json_loads: Callable[[bytes], Any] = orjson.loads
+
+RETRY_STATUS_CODES: Final[frozenset[int]] = frozenset({502, 503, 504})
+MAX_RETRIES: Final = 3
+BACKOFF_BASE: Final = 2  # seconds
+MAX_BACKOFF: Final = 30  # seconds
+
+# Endpoint groups accepted by HomevoltApiClient.async_get_all()
+FETCHERS: Final = {
+    "ems": "async_get_ems_data",
+    "status": "async_get_status",
+    "error_report": "async_get_error_report",
+    "nodes": "async_get_nodes",
+    "schedule": "async_get_schedule",
+}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return a full-jitter backoff delay for the given retry attempt."""
+    return random.uniform(0, min(MAX_BACKOFF, BACKOFF_BASE * 2**attempt))
+
+
+def _parse_ems(raw: bytes) -> HomevoltEmsResponse:
+    """Decode and parse an /ems.json body."""
+    return HomevoltEmsResponse.from_dict(_json_loads(raw))
+
+
+def _parse_status(raw: bytes) -> HomevoltStatusResponse:
+    """Decode and parse a /status.json body."""
+    return HomevoltStatusResponse.from_dict(_json_loads(raw))
+
+
+def _parse_error_report(raw: bytes) -> list[ErrorReportEntry]:
+    """Decode and parse an /error_report.json body."""
+    return [ErrorReportEntry.from_dict(e) for e in _json_loads(raw)]
+
+
+def _parse_nodes(raw: bytes) -> tuple[NodeInfo, ...]:
+    """Decode and parse a /nodes.json body."""
+    return tuple(map(NodeInfo.from_dict, _json_loads(raw)))
+
+
+def _parse_node_metrics(raw: bytes) -> NodeMetrics:
+    """Decode and parse a /node_metrics.json body."""
+    return NodeMetrics.from_dict(_json_loads(raw))
+
+
+def _parse_schedule(raw: bytes) -> ScheduleData:
+    """Decode and parse a /schedule.json body."""
+    return ScheduleData.from_dict(_json_loads(raw))
+
+
+def _as_stale(result: Any) -> Any:
+    """Return a copy of a response model flagged as stale, if it carries the flag.
+
+    The cached object is shared with earlier coordinator snapshots, so it is
+    never modified in place.
+    """
+    if isinstance(result, HomevoltEmsResponse):
+        return replace(result, is_stale=True)
+    return result
+
+
+class _NotModified:
+    """Sentinel returned by _request when the device answers 304."""
+
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+
+NOT_MODIFIED: Final = _NotModified()
+
+
+class _Inflight:
+    """A fetch shared by concurrent callers and the number still waiting."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        """Track a new shared fetch task."""
+        self.task = task
+        self.waiters = 0
 
 
 class HomevoltApiError(Exception):
@@ -58,40 +145,81 @@ class HomevoltApiClient:
         use_ssl: bool = False,
         connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
         read_timeout: int = DEFAULT_READ_TIMEOUT,
+        stale_ttl: float = 0,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        With a positive ``stale_ttl`` (seconds), a failed fetch returns the
+        last good result for that endpoint if it is younger than the TTL.
+        """
         self._session = session
         self._host = host
         self._port = port
         self._password = password
         self._use_ssl = use_ssl
-        self._connect_timeout = connect_timeout
-        self._read_timeout = read_timeout
         scheme = "https" if use_ssl else "http"
         self._base_url = f"{scheme}://{host}:{port}"
+        # Per-request constants, built once instead of on every poll
+        self._auth = aiohttp.BasicAuth("admin", password) if password else None
+        self._timeout = aiohttp.ClientTimeout(
+            connect=connect_timeout,
+            total=read_timeout,
+        )
+        self._urls = {
+            endpoint: f"{self._base_url}{endpoint}"
+            for endpoint in (
+                ENDPOINT_EMS,
+                ENDPOINT_STATUS,
+                ENDPOINT_PARAMS,
+                ENDPOINT_ERROR_REPORT,
+                ENDPOINT_SCHEDULE,
+                ENDPOINT_CONSOLE,
+                ENDPOINT_NODES,
+                ENDPOINT_NODE_METRICS,
+            )
+        }
+        # Conditional GET headers (If-None-Match / If-Modified-Since) and the
+        # objects parsed from the matching responses, keyed by endpoint
+        self._validators: dict[str, dict[str, str]] = {}
+        self._parsed: dict[str, Any] = {}
+        # Body each parsed object was built from, so unchanged bodies skip
+        # parsing on devices that ignore If-None-Match. Comparing the bytes
+        # is exact and stops at the first difference, unlike hashing the
+        # whole body on every fetch.
+        self._body: dict[str, bytes] = {}
+        # Monotonic time of the last successful fetch per endpoint
+        self._stale_ttl = stale_ttl
+        self._last_good: dict[str, float] = {}
+        # Pending fetches shared by concurrent callers, keyed by endpoint
+        self._inflight: dict[str, _Inflight] = {}
 
     @property
     def host(self) -> str:
         """Return the host."""
         return self._host
 
-    async def _request(self, endpoint: str, method: str = "GET", **kwargs: Any) -> dict | list:
-        """Make an HTTP request with retry logic."""
-        url = f"{self._base_url}{endpoint}"
-        auth = None
-        if self._password:
-            auth = aiohttp.BasicAuth("admin", self._password)
+    async def _request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        conditional: bool = False,
+        **kwargs: Any,
+    ) -> bytes | _NotModified:
+        """Make an HTTP request with retry logic and return the raw body.
 
-        timeout = aiohttp.ClientTimeout(
-            connect=self._connect_timeout,
-            total=self._read_timeout,
-        )
+        With ``conditional`` set, the last ETag and Last-Modified seen for the
+        endpoint are sent as If-None-Match and If-Modified-Since, and
+        ``NOT_MODIFIED`` is returned on a 304 reply.
+        """
+        url = self._urls.get(endpoint) or f"{self._base_url}{endpoint}"
+        if conditional and endpoint in self._validators:
+            kwargs["headers"] = self._validators[endpoint]
 
         last_error: Exception | None = None
         for attempt in range(MAX_RETRIES):
             try:
                 async with self._session.request(
-                    method, url, auth=auth, timeout=timeout, **kwargs
+                    method, url, auth=self._auth, timeout=self._timeout, **kwargs
                 ) as resp:
                     if resp.status == 401:
                         raise HomevoltAuthError("Invalid credentials")
@@ -100,52 +228,174 @@ class HomevoltApiClient:
                             f"Server error {resp.status} from {endpoint}"
                         )
                         if attempt < MAX_RETRIES - 1:
-                            await asyncio.sleep(BACKOFF_BASE ** (attempt + 1))
+                            await asyncio.sleep(_backoff_delay(attempt))
                             continue
                         raise last_error
+                    if resp.status == 304 and conditional:
+                        return NOT_MODIFIED
                     resp.raise_for_status()
-                    return await resp.json()
+                    validators: dict[str, str] = {}
+                    if etag := resp.headers.get("ETag"):
+                        validators["If-None-Match"] = etag
+                    if modified := resp.headers.get("Last-Modified"):
+                        validators["If-Modified-Since"] = modified
+                    if validators:
+                        self._validators[endpoint] = validators
+                    return await resp.read()
             except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
                 last_error = HomevoltConnectionError(
                     f"Connection error to {self._host}: {err}"
                 )
                 if attempt < MAX_RETRIES - 1:
-                    await asyncio.sleep(BACKOFF_BASE ** (attempt + 1))
+                    await asyncio.sleep(_backoff_delay(attempt))
                     continue
                 raise last_error from err
 
         # Should not reach here, but just in case
         raise last_error or HomevoltApiError("Unknown error")
 
+    async def _fetch(
+        self,
+        endpoint: str,
+        parse: Callable[[bytes], Any],
+        in_executor: bool = False,
+    ) -> Any:
+        """GET and parse an endpoint, sharing one request between callers.
+
+        The request runs in a task no single caller owns: a cancelled caller
+        stops waiting, and the task is only cancelled once nobody waits on it.
+        Large payloads set ``in_executor`` so decoding and model construction
+        run in one executor job instead of blocking the event loop.
+        """
+        inflight = self._inflight.get(endpoint)
+        if inflight is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_uncached(endpoint, parse, in_executor)
+            )
+            inflight = self._inflight[endpoint] = _Inflight(task)
+            task.add_done_callback(
+                lambda _task: self._fetch_done(endpoint, inflight)
+            )
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            if inflight.waiters == 1:
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+
+    def _fetch_done(self, endpoint: str, inflight: _Inflight) -> None:
+        """Forget a finished shared fetch."""
+        if self._inflight.get(endpoint) is inflight:
+            del self._inflight[endpoint]
+        if not inflight.task.cancelled():
+            # Mark retrieved so an error nobody is left to await is not logged
+            inflight.task.exception()
+
+    async def _fetch_uncached(
+        self, endpoint: str, parse: Callable[[bytes], Any], in_executor: bool
+    ) -> Any:
+        """GET an endpoint, reusing the previously parsed object on 304."""
+        conditional = endpoint in self._parsed
+        try:
+            raw = await self._request(endpoint, conditional=conditional)
+        except HomevoltAuthError:
+            raise
+        except HomevoltApiError as err:
+            last_good = self._last_good.get(endpoint)
+            if last_good is None or monotonic() - last_good >= self._stale_ttl:
+                raise
+            _LOGGER.warning("Using cached %s after error: %s", endpoint, err)
+            return _as_stale(self._parsed[endpoint])
+
+        if raw is NOT_MODIFIED:
+            result = self._parsed[endpoint]
+        elif raw == self._body.get(endpoint):
+            result = self._parsed[endpoint]
+        else:
+            if in_executor:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, parse, raw
+                )
+            else:
+                result = parse(raw)
+            self._body[endpoint] = raw
+        self._parsed[endpoint] = result
+        self._last_good[endpoint] = monotonic()
+        return result
+
     async def async_get_ems_data(self) -> HomevoltEmsResponse:
         """Fetch EMS data from /ems.json."""
-        data = await self._request(ENDPOINT_EMS)
-        return HomevoltEmsResponse.from_dict(data)
+        return await self._fetch(ENDPOINT_EMS, _parse_ems, in_executor=True)
 
     async def async_get_status(self) -> HomevoltStatusResponse:
         """Fetch system status from /status.json."""
-        data = await self._request(ENDPOINT_STATUS)
-        return HomevoltStatusResponse.from_dict(data)
+        return await self._fetch(ENDPOINT_STATUS, _parse_status)
 
     async def async_get_error_report(self) -> list[ErrorReportEntry]:
         """Fetch error report from /error_report.json."""
-        data = await self._request(ENDPOINT_ERROR_REPORT)
-        return [ErrorReportEntry.from_dict(e) for e in data]
+        return await self._fetch(
+            ENDPOINT_ERROR_REPORT, _parse_error_report, in_executor=True
+        )
 
-    async def async_get_nodes(self) -> list[NodeInfo]:
+    async def async_get_nodes(self) -> tuple[NodeInfo, ...]:
         """Fetch node info from /nodes.json."""
-        data = await self._request(ENDPOINT_NODES)
-        return [NodeInfo.from_dict(n) for n in data]
+        return await self._fetch(ENDPOINT_NODES, _parse_nodes)
 
     async def async_get_node_metrics(self, node_id: int) -> NodeMetrics:
         """Fetch node metrics from /node_metrics.json?node_id={id}."""
-        data = await self._request(f"{ENDPOINT_NODE_METRICS}?node_id={node_id}")
-        return NodeMetrics.from_dict(data)
+        return await self._fetch(
+            f"{ENDPOINT_NODE_METRICS}?node_id={node_id}", _parse_node_metrics
+        )
 
     async def async_get_schedule(self) -> ScheduleData:
         """Fetch schedule from /schedule.json."""
-        data = await self._request(ENDPOINT_SCHEDULE)
-        return ScheduleData.from_dict(data)
+        return await self._fetch(ENDPOINT_SCHEDULE, _parse_schedule)
+
+    async def async_get_all(self, want: Iterable[str]) -> dict[str, Any]:
+        """Fetch several endpoint groups (keys of FETCHERS) concurrently.
+
+        Each value is the parsed result, or the exception raised for it.
+        """
+        names = list(want)
+        results = await asyncio.gather(
+            *(getattr(self, FETCHERS[name])() for name in names),
+            return_exceptions=True,
+        )
+        return dict(zip(names, results))
+
+    async def async_ping(self) -> bool:
+        """Check reachability and credentials with a HEAD of /ems.json.
+
+        Any other unsuccessful HEAD reply (firmware that does not support or
+        route HEAD) is rechecked with a GET, and a device that still does not
+        answer successfully is reported as unreachable.
+        """
+        try:
+            async with self._session.head(
+                self._urls[ENDPOINT_EMS], auth=self._auth, timeout=self._timeout
+            ) as resp:
+                status = resp.status
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+            raise HomevoltConnectionError(
+                f"Connection error to {self._host}: {err}"
+            ) from err
+        if status == 401:
+            raise HomevoltAuthError("Invalid credentials")
+        if 200 <= status < 300:
+            return True
+
+        try:
+            await self._request(ENDPOINT_EMS)
+        except (HomevoltAuthError, HomevoltConnectionError):
+            raise
+        except (HomevoltApiError, aiohttp.ClientResponseError) as err:
+            raise HomevoltConnectionError(
+                f"Unexpected response from {self._host}: {err}"
+            ) from err
+        return True
 
     async def async_validate_connection(self) -> HomevoltEmsResponse:
         """Validate connectivity by fetching EMS data. Used in config flow."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -16,8 +17,9 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import UNCONFIGURED_EUID
 from .coordinator import HomevoltCoordinator
-from .entity import HomevoltEntity, HomevoltSensorDeviceEntity
+from .entity import HomevoltEntity, HomevoltSensorDeviceEntity, optional_attr
 from .models import HomevoltData, NodeInfo, NodeMetrics, SensorData
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,25 +29,27 @@ _LOGGER = logging.getLogger(__name__)
 # Custom binary sensor descriptions
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class HomevoltBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Homevolt system binary sensor."""
 
-    value_fn: Callable[[HomevoltData], bool | None] | None = None
+    value_fn: Callable[[HomevoltData], bool | None]
+    # Polling tier the value is read from
+    tier: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class HomevoltCtBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Homevolt CT clamp binary sensor."""
 
-    value_fn: Callable[[SensorData], bool | None] | None = None
+    value_fn: Callable[[SensorData], bool | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class HomevoltCtNodeBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Homevolt CT node binary sensor."""
 
-    value_fn: Callable[[NodeMetrics | None, NodeInfo | None], bool | None] | None = None
+    value_fn: Callable[[NodeMetrics | None, NodeInfo | None], bool | None]
 
 
 # ---------------------------------------------------------------------------
@@ -58,7 +62,7 @@ CT_BINARY_SENSORS: tuple[HomevoltCtBinarySensorEntityDescription, ...] = (
         translation_key="ct_available",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.available,
+        value_fn=attrgetter("available"),
     ),
 )
 
@@ -95,20 +99,23 @@ SYSTEM_BINARY_SENSORS: tuple[HomevoltBinarySensorEntityDescription, ...] = (
         translation_key="wifi_connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.status.wifi_status.connected if data.status is not None else None,
+        value_fn=optional_attr("status.wifi_status.connected"),
+        tier="status",
     ),
     HomevoltBinarySensorEntityDescription(
         key="mqtt_connected",
         translation_key="mqtt_connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.status.mqtt_status.connected if data.status is not None else None,
+        value_fn=optional_attr("status.mqtt_status.connected"),
+        tier="status",
     ),
     HomevoltBinarySensorEntityDescription(
         key="schedule_local_mode",
         translation_key="schedule_local_mode",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.schedule.local_mode if data.schedule is not None else None,
+        value_fn=optional_attr("schedule.local_mode"),
+        tier="schedule",
     ),
 )
 
@@ -129,15 +136,13 @@ class HomevoltBinarySensor(HomevoltEntity, BinarySensorEntity):
         description: HomevoltBinarySensorEntityDescription,
     ) -> None:
         """Initialize a system binary sensor."""
-        super().__init__(coordinator, ecu_id)
+        super().__init__(coordinator, ecu_id, description.tier)
         self.entity_description = description
         self._attr_unique_id = f"{ecu_id}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
-        if self.entity_description.value_fn is None:
-            return None
         return self.entity_description.value_fn(self.coordinator.data)
 
 
@@ -159,16 +164,25 @@ class HomevoltCtBinarySensor(HomevoltSensorDeviceEntity, BinarySensorEntity):
         super().__init__(coordinator, ecu_id, sensor_index, sensor_type, euid)
         self.entity_description = description
         self._attr_unique_id = f"{euid}_{description.key}"
+        # Sensor resolved from the coordinator snapshot it was looked up in
+        self._snapshot: HomevoltData | None = None
+        self._sensor: SensorData | None = None
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
-        sensors = self.coordinator.data.ems.sensors
-        if self._sensor_index >= len(sensors):
-            return None
-        if self.entity_description.value_fn is None:
+        data = self.coordinator.data
+        if data is not self._snapshot:
+            sensors = data.ems.sensors
+            self._sensor = (
+                sensors[self._sensor_index]
+                if self._sensor_index < len(sensors)
+                else None
+            )
+            self._snapshot = data
+        if self._sensor is None:
             return None
-        return self.entity_description.value_fn(sensors[self._sensor_index])
+        return self.entity_description.value_fn(self._sensor)
 
 
 class HomevoltCtNodeBinarySensor(HomevoltSensorDeviceEntity, BinarySensorEntity):
@@ -187,22 +201,26 @@ class HomevoltCtNodeBinarySensor(HomevoltSensorDeviceEntity, BinarySensorEntity)
         description: HomevoltCtNodeBinarySensorEntityDescription,
     ) -> None:
         """Initialize a CT node binary sensor."""
-        super().__init__(coordinator, ecu_id, sensor_index, sensor_type, euid)
+        super().__init__(
+            coordinator, ecu_id, sensor_index, sensor_type, euid, "nodes"
+        )
         self._node_id = node_id
         self.entity_description = description
         self._attr_unique_id = f"{euid}_{description.key}"
+        # Node data resolved from the coordinator snapshot it was looked up in
+        self._snapshot: HomevoltData | None = None
+        self._metrics: NodeMetrics | None = None
+        self._node_info: NodeInfo | None = None
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
-        if self.entity_description.value_fn is None:
-            return None
-        metrics = self.coordinator.data.node_metrics.get(self._node_id)
-        node_info = next(
-            (n for n in self.coordinator.data.nodes if n.node_id == self._node_id),
-            None,
-        )
-        return self.entity_description.value_fn(metrics, node_info)
+        data = self.coordinator.data
+        if data is not self._snapshot:
+            self._metrics = data.node_metrics.get(self._node_id)
+            self._node_info = data.nodes_by_id.get(self._node_id)
+            self._snapshot = data
+        return self.entity_description.value_fn(self._metrics, self._node_info)
 
 
 # ---------------------------------------------------------------------------
@@ -216,41 +234,47 @@ async def async_setup_entry(
 ) -> None:
     """Set up Homevolt binary sensor entities from a config entry."""
     coordinator: HomevoltCoordinator = entry.runtime_data
-    data = coordinator.data
-    entities: list[BinarySensorEntity] = []
+    ems = coordinator.data.ems
 
-    ems_list = data.ems.ems
+    ems_list = ems.ems
     if not ems_list:
         _LOGGER.error("No EMS devices found in Homevolt data")
         return
 
-    ecu_id = str(ems_list[0].ecu_id)
-
-    # --- System binary sensors ---
-    for desc in SYSTEM_BINARY_SENSORS:
-        entities.append(HomevoltBinarySensor(coordinator, ecu_id, desc))
-
-    # --- CT clamp binary sensors (skip unconfigured) ---
-    for sensor_idx, sensor_data in enumerate(data.ems.sensors):
-        euid = sensor_data.euid
-        sensor_type = sensor_data.type
-        if not euid or euid == "0000000000000000":
-            continue
-        for desc in CT_BINARY_SENSORS:
-            entities.append(
-                HomevoltCtBinarySensor(
-                    coordinator, ecu_id, sensor_idx, sensor_type, euid, desc
-                )
+    ecu_id = ems_list[0].ecu_id
+
+    # Configured CT clamps only (unconfigured slots have an all-zero EUID)
+    active_cts = [
+        (sensor_idx, sensor_data)
+        for sensor_idx, sensor_data in enumerate(ems.sensors)
+        if sensor_data.euid and sensor_data.euid != UNCONFIGURED_EUID
+    ]
+
+    entities: list[BinarySensorEntity] = [
+        # --- System binary sensors ---
+        *(
+            HomevoltBinarySensor(coordinator, ecu_id, desc)
+            for desc in SYSTEM_BINARY_SENSORS
+        ),
+        # --- CT clamp binary sensors ---
+        *(
+            HomevoltCtBinarySensor(
+                coordinator, ecu_id, sensor_idx, sensor_data.type, sensor_data.euid, desc
+            )
+            for sensor_idx, sensor_data in active_cts
+            for desc in CT_BINARY_SENSORS
+        ),
+        # --- CT node binary sensors (USB power, firmware update) ---
+        *(
+            HomevoltCtNodeBinarySensor(
+                coordinator, ecu_id, sensor_idx, sensor_data.type, sensor_data.euid,
+                sensor_data.node_id, desc,
             )
-        # CT node binary sensors (USB power, firmware update)
-        if sensor_data.node_id:
-            for desc in CT_NODE_BINARY_SENSORS:
-                entities.append(
-                    HomevoltCtNodeBinarySensor(
-                        coordinator, ecu_id, sensor_idx, sensor_type, euid,
-                        sensor_data.node_id, desc,
-                    )
-                )
+            for sensor_idx, sensor_data in active_cts
+            if sensor_data.node_id
+            for desc in CT_NODE_BINARY_SENSORS
+        ),
+    ]
 
     async_add_entities(entities)
     _LOGGER.debug(
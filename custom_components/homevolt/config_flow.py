@@ -14,7 +14,10 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import HomevoltApiClient, HomevoltAuthError, HomevoltConnectionError
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_SCAN_INTERVAL,
+    CONFIG_FLOW_READ_TIMEOUT,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
@@ -22,14 +25,23 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+SCAN_INTERVAL_VALIDATOR = vol.All(int, vol.Range(min=10, max=300))
+
 USER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
         vol.Optional(CONF_PASSWORD): str,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-            int, vol.Range(min=10, max=300)
-        ),
+        vol.Optional(
+            CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+        ): SCAN_INTERVAL_VALIDATOR,
+        vol.Optional(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): bool,
+    }
+)
+
+ZEROCONF_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PASSWORD): str,
     }
 )
 
@@ -43,6 +55,22 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._host: str | None = None
         self._port: int = DEFAULT_PORT
+        self._clients: dict[tuple[str, int, str | None], HomevoltApiClient] = {}
+
+    def _get_client(
+        self, host: str, port: int, password: str | None = None
+    ) -> HomevoltApiClient:
+        """Return a client for these settings, reusing one from an earlier step."""
+        key = (host, port, password)
+        if (client := self._clients.get(key)) is None:
+            client = self._clients[key] = HomevoltApiClient(
+                session=async_get_clientsession(self.hass),
+                host=host,
+                port=port,
+                password=password,
+                read_timeout=CONFIG_FLOW_READ_TIMEOUT,
+            )
+        return client
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -55,10 +83,7 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
             port = user_input.get(CONF_PORT, DEFAULT_PORT)
             password = user_input.get(CONF_PASSWORD)
 
-            session = async_get_clientsession(self.hass)
-            client = HomevoltApiClient(
-                session=session, host=host, port=port, password=password
-            )
+            client = self._get_client(host, port, password)
 
             try:
                 ems_data = await client.async_validate_connection()
@@ -71,7 +96,7 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             else:
                 # Use ecu_id from first EMS device as unique ID
-                ecu_id = str(ems_data.ems[0].ecu_id) if ems_data.ems else host
+                ecu_id = ems_data.ems[0].ecu_id if ems_data.ems else host
                 await self.async_set_unique_id(ecu_id)
                 self._abort_if_unique_id_configured()
 
@@ -86,6 +111,9 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_SCAN_INTERVAL: user_input.get(
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
+                        CONF_ADAPTIVE_POLLING: user_input.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
                     },
                 )
 
@@ -105,8 +133,7 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
         self._port = port
 
         # Try to connect and get unique ID
-        session = async_get_clientsession(self.hass)
-        client = HomevoltApiClient(session=session, host=host, port=port)
+        client = self._get_client(host, port)
 
         try:
             ems_data = await client.async_validate_connection()
@@ -116,7 +143,7 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
             _LOGGER.debug("Unexpected error during Zeroconf validation", exc_info=True)
             return self.async_abort(reason="cannot_connect")
 
-        ecu_id = str(ems_data.ems[0].ecu_id) if ems_data.ems else host
+        ecu_id = ems_data.ems[0].ecu_id if ems_data.ems else host
         await self.async_set_unique_id(ecu_id)
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
@@ -138,16 +165,13 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
                 },
                 options={
                     CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                    CONF_ADAPTIVE_POLLING: DEFAULT_ADAPTIVE_POLLING,
                 },
             )
 
         return self.async_show_form(
             step_id="zeroconf_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=ZEROCONF_CONFIRM_SCHEMA,
             description_placeholders={"host": self._host},
         )
 
@@ -162,13 +186,12 @@ class HomevoltConfigFlow(ConfigFlow, domain=DOMAIN):
             port = user_input.get(CONF_PORT, DEFAULT_PORT)
             password = user_input.get(CONF_PASSWORD)
 
-            session = async_get_clientsession(self.hass)
-            client = HomevoltApiClient(
-                session=session, host=host, port=port, password=password
-            )
+            client = self._get_client(host, port, password)
 
             try:
-                await client.async_validate_connection()
+                # The entry's unique ID is kept, so reachability and
+                # credentials are all that need checking
+                await client.async_ping()
             except HomevoltAuthError:
                 errors["base"] = "invalid_auth"
             except HomevoltConnectionError:
@@ -225,14 +248,18 @@ class HomevoltOptionsFlow(OptionsFlow):
         current = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
+        adaptive = self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_SCAN_INTERVAL, default=current): vol.All(
-                        int, vol.Range(min=10, max=300)
-                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL, default=current
+                    ): SCAN_INTERVAL_VALIDATOR,
+                    vol.Optional(CONF_ADAPTIVE_POLLING, default=adaptive): bool,
                 }
             ),
         )
@@ -16,18 +16,46 @@ ENDPOINT_NODE_METRICS: Final = "/node_metrics.json"
 
 # Config keys
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL: Final = 30
 DEFAULT_PORT: Final = 80
 DEFAULT_CONNECT_TIMEOUT: Final = 5
 DEFAULT_READ_TIMEOUT: Final = 20
+# Config flow requests run while the user waits on the form
+CONFIG_FLOW_READ_TIMEOUT: Final = DEFAULT_READ_TIMEOUT - 2
+DEFAULT_ADAPTIVE_POLLING: Final = True
 
-# Tiered polling intervals (in number of cycles)
-STATUS_POLL_INTERVAL: Final = 10  # Every 10th cycle (~5 min at 30s)
-ERROR_REPORT_POLL_INTERVAL: Final = 4  # Every 4th cycle (~2 min at 30s)
-NODES_POLL_INTERVAL: Final = 10  # Every 10th cycle (~5 min at 30s)
-SCHEDULE_POLL_INTERVAL: Final = 10  # Every 10th cycle (~5 min at 30s)
+# After a failed fetch, the last good payload is served for up to this many
+# scan intervals before the error is raised
+STALE_TTL_CYCLES: Final = 5
+
+# Adaptive polling: the interval doubles on every cycle with unchanged EMS
+# data, up to this many times the configured interval (and at most 5 min)
+ADAPTIVE_MAX_FACTOR: Final = 8
+ADAPTIVE_MAX_INTERVAL: Final = 300
+
+# Tiered polling intervals (in seconds)
+STATUS_POLL_INTERVAL: Final = 300  # Every ~5 min
+ERROR_REPORT_POLL_INTERVAL: Final = 120  # Every ~2 min
+NODES_POLL_INTERVAL: Final = 300  # Every ~5 min
+SCHEDULE_POLL_INTERVAL: Final = 300  # Every ~5 min
+# Each tier's next deadline is randomised by this fraction of its interval so
+# the slow endpoints drift apart instead of all landing on the same cycle
+POLL_JITTER: Final = 0.1
+
+# Slow-tier data is persisted so a restart only fetches what is due; writes
+# are coalesced over this many seconds
+STORAGE_VERSION: Final = 2
+STORAGE_SAVE_DELAY: Final = 60
+
+# Maximum concurrent /node_metrics.json requests per refresh; the ECU's
+# embedded HTTP server starts dropping requests beyond a few in parallel
+NODE_METRICS_CONCURRENCY: Final = 3
+
+# EUID reported for an empty CT clamp slot
+UNCONFIGURED_EUID: Final = "0000000000000000"
 
 # Manufacturer info
 MANUFACTURER: Final = "Tibber / Polarium"
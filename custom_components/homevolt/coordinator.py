@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from dataclasses import replace
 from datetime import timedelta
+from functools import partial
 import logging
+import random
+from time import monotonic, time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -15,19 +23,75 @@ from homeassistant.helpers.update_coordinator import (
 
 from .api import HomevoltApiClient, HomevoltAuthError, HomevoltConnectionError
 from .const import (
+    ADAPTIVE_MAX_FACTOR,
+    ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
     ERROR_REPORT_POLL_INTERVAL,
+    NODE_METRICS_CONCURRENCY,
     NODES_POLL_INTERVAL,
+    POLL_JITTER,
     SCHEDULE_POLL_INTERVAL,
     STATUS_POLL_INTERVAL,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UNCONFIGURED_EUID,
+)
+from .models import (
+    ErrorReportEntry,
+    HomevoltData,
+    HomevoltStatusResponse,
+    NodeInfo,
+    NodeMetrics,
+    ScheduleData,
+    SensorData,
+    to_dict,
 )
-from .models import HomevoltData
 
 _LOGGER = logging.getLogger(__name__)
 
 # Python 3.9-compatible type alias (3.12 would use: type HomevoltConfigEntry = ...)
 HomevoltConfigEntry = ConfigEntry
 
+# Slow polling tiers and their refresh interval in seconds
+_TIER_INTERVALS: dict[str, int] = {
+    "status": STATUS_POLL_INTERVAL,
+    "error_report": ERROR_REPORT_POLL_INTERVAL,
+    "nodes": NODES_POLL_INTERVAL,
+    "schedule": SCHEDULE_POLL_INTERVAL,
+}
+
+# EMS state fields and the event fired when their value changes
+_STATE_EVENTS: tuple[tuple[str, str], ...] = (
+    ("alarm_str", "homevolt_alarm"),
+    ("warning_str", "homevolt_warning"),
+    ("info_str", "homevolt_info"),
+)
+
+
+class _CacheStore(Store[dict[str, Any]]):
+    """Store for the slow-tier cache; older layouts are dropped, not migrated."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Discard data saved in an older layout; the next refresh refetches it."""
+        return {}
+
+
+def adaptive_max_interval(scan_interval: int) -> int:
+    """Return the longest interval adaptive polling backs off to, in seconds."""
+    return max(
+        scan_interval, min(scan_interval * ADAPTIVE_MAX_FACTOR, ADAPTIVE_MAX_INTERVAL)
+    )
+
+
+def _node_metrics_to_store(metrics: NodeMetrics) -> dict[str, Any]:
+    """Return node metrics in the /node_metrics.json shape from_dict reads."""
+    node = to_dict(metrics)
+    return {"node": node, "packet_delivery_rate": node.pop("packet_delivery_rate")}
+
 
 class HomevoltCoordinator(DataUpdateCoordinator[HomevoltData]):
     """Coordinator for Homevolt data updates with tiered polling."""
@@ -40,6 +104,7 @@ class HomevoltCoordinator(DataUpdateCoordinator[HomevoltData]):
         config_entry: HomevoltConfigEntry,
         client: HomevoltApiClient,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -50,79 +115,117 @@ class HomevoltCoordinator(DataUpdateCoordinator[HomevoltData]):
             update_interval=timedelta(seconds=scan_interval),
         )
         self.client = client
-        self._poll_count = 0
+        # Monotonic deadline at which each slow tier is next due
+        self._next_due: dict[str, float] = dict.fromkeys(_TIER_INTERVALS, 0.0)
+        # Slow-tier data persisted across restarts
+        self._store: Store[dict[str, Any]] = _CacheStore(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self._restored: HomevoltData | None = None
+        # Node ids of the configured CT clamps, recomputed only when the
+        # (euid, node_id) layout of the EMS sensor list changes
+        self._ct_sensor_sig: tuple[tuple[str, int], ...] = ()
+        self._ct_node_ids: tuple[int, ...] = ()
+        # Tiers whose data changed in the last refresh (None: treat all as
+        # changed), and whether the next notification must wake everyone
+        self._changed_tiers: set[str] | None = None
+        self._wake_all = True
+        self._adaptive_polling = adaptive_polling
+        self._base_interval = timedelta(seconds=scan_interval)
+        self._max_interval = timedelta(seconds=adaptive_max_interval(scan_interval))
 
     async def _async_update_data(self) -> HomevoltData:
         """Fetch data from the Homevolt API with tiered polling."""
-        self._poll_count += 1
+        now = monotonic()
+        prev = self.data
+        self._changed_tiers = None
+        # Tiers not fetched this cycle carry forward from the previous
+        # snapshot, or on the first refresh from the data restored from disk
+        base = prev if prev is not None else self._restored
+
+        # Always fetch EMS data (primary data source); slower tiers once their
+        # deadline has passed. Everything due this cycle is requested
+        # concurrently.
+        want = ["ems"]
+        want.extend(
+            tier
+            for tier, due in self._next_due.items()
+            if base is None or now >= due
+        )
 
         try:
-            # Always fetch EMS data (primary data source)
-            ems = await self.client.async_get_ems_data()
-
-            # Build the combined data object
-            combined = HomevoltData(ems=ems)
-
-            # Fetch status data every Nth cycle
-            if self._poll_count % STATUS_POLL_INTERVAL == 0 or self.data is None:
-                combined.status = await self.client.async_get_status()
-            elif self.data is not None:
-                combined.status = self.data.status
-
-            # Fetch error report every Nth cycle
-            if self._poll_count % ERROR_REPORT_POLL_INTERVAL == 0 or self.data is None:
-                combined.error_report = await self.client.async_get_error_report()
-            elif self.data is not None:
-                combined.error_report = self.data.error_report
-
-            # Fetch nodes and node metrics every Nth cycle
-            if self._poll_count % NODES_POLL_INTERVAL == 0 or self.data is None:
-                combined.nodes = await self.client.async_get_nodes()
-                # Fetch metrics for each configured CT sensor node
-                for sensor in combined.ems.sensors:
-                    if sensor.euid and sensor.euid != "0000000000000000" and sensor.node_id:
-                        try:
-                            metrics = await self.client.async_get_node_metrics(sensor.node_id)
-                            combined.node_metrics[sensor.node_id] = metrics
-                        except Exception:
-                            _LOGGER.warning(
-                                "Failed to fetch node_metrics for node %s",
-                                sensor.node_id,
-                            )
-            elif self.data is not None:
-                combined.nodes = self.data.nodes
-                combined.node_metrics = self.data.node_metrics
-
-            # Fetch schedule every Nth cycle (non-fatal)
-            if self._poll_count % SCHEDULE_POLL_INTERVAL == 0 or self.data is None:
-                try:
-                    combined.schedule = await self.client.async_get_schedule()
-                except Exception:
-                    _LOGGER.warning("Failed to fetch schedule data")
-                    if self.data is not None:
-                        combined.schedule = self.data.schedule
-            elif self.data is not None:
-                combined.schedule = self.data.schedule
+            results = await self.client.async_get_all(want)
+            if isinstance(results["ems"], BaseException):
+                raise results["ems"]
+
+            # Slow tiers degrade gracefully: a failed fetch keeps the last
+            # known value and the tier stays due. Only bad credentials are
+            # fatal, since every later request would fail the same way.
+            fetched: dict[str, Any] = {}
+            for tier in want[1:]:
+                result = results[tier]
+                if isinstance(result, HomevoltAuthError):
+                    raise result
+                if isinstance(result, BaseException):
+                    _LOGGER.warning("Failed to fetch %s data: %s", tier, result)
+                else:
+                    fetched[tier] = result
+
+            # Build the combined data object, carrying forward what was not
+            # fetched this cycle
+            combined = (
+                replace(base, ems=results["ems"])
+                if base is not None
+                else HomevoltData(ems=results["ems"])
+            )
+            # Tier names match the HomevoltData attributes they fill
+            for tier, result in fetched.items():
+                setattr(combined, tier, result)
+
+            if "nodes" in fetched:
+                # Fetch metrics for each configured CT sensor node concurrently
+                combined.node_metrics = await self._async_fetch_node_metrics(
+                    self._configured_node_ids(combined.ems.sensors)
+                )
+
+            # Each tier is rescheduled independently; one that failed stays
+            # due and is retried on the next refresh
+            for tier in fetched:
+                self._next_due[tier] = now + _TIER_INTERVALS[tier] * (
+                    1 + random.uniform(-POLL_JITTER, POLL_JITTER)
+                )
+            self._restored = None
+            # Parsed objects are reused for unchanged payloads, so identity
+            # tells whether a tier changed; node metrics are always new
+            self._changed_tiers = {
+                tier
+                for tier, result in fetched.items()
+                if tier == "nodes" or prev is None or result is not getattr(prev, tier)
+            }
+            if fetched:
+                self._store.async_delay_save(
+                    partial(self._data_to_store, combined), STORAGE_SAVE_DELAY
+                )
+
+            # A stale EMS copy says nothing about whether the data changed
+            if (
+                self._adaptive_polling
+                and prev is not None
+                and not combined.ems.is_stale
+            ):
+                self._adapt_interval(combined.ems != prev.ems)
 
             # Fire events when alarm/warning/info state changes
-            if self.data is not None:
-                prev = self.data.ems.aggregated.ems_data
-                curr = combined.ems.aggregated.ems_data
-                if prev.alarm_str != curr.alarm_str:
-                    self.hass.bus.async_fire(
-                        "homevolt_alarm",
-                        {"previous": prev.alarm_str, "current": curr.alarm_str},
-                    )
-                if prev.warning_str != curr.warning_str:
-                    self.hass.bus.async_fire(
-                        "homevolt_warning",
-                        {"previous": prev.warning_str, "current": curr.warning_str},
-                    )
-                if prev.info_str != curr.info_str:
-                    self.hass.bus.async_fire(
-                        "homevolt_info",
-                        {"previous": prev.info_str, "current": curr.info_str},
-                    )
+            if prev is not None:
+                prev_state = prev.ems.aggregated.ems_data
+                curr_state = combined.ems.aggregated.ems_data
+                for attr, event in _STATE_EVENTS:
+                    previous = getattr(prev_state, attr)
+                    current = getattr(curr_state, attr)
+                    if previous != current:
+                        self.hass.bus.async_fire(
+                            event, {"previous": previous, "current": current}
+                        )
 
         except HomevoltAuthError as err:
             raise ConfigEntryAuthFailed("Invalid credentials") from err
@@ -130,3 +233,121 @@ class HomevoltCoordinator(DataUpdateCoordinator[HomevoltData]):
             raise UpdateFailed(f"Error communicating with Homevolt: {err}") from err
 
         return combined
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, skipping those bound to a tier that did not change.
+
+        Entities register with their polling tier as listener context; those
+        without one (EMS-backed or time-dependent) are always updated. After
+        a failed refresh every listener is woken so availability updates.
+        """
+        changed = None if self._wake_all else self._changed_tiers
+        self._wake_all = not self.last_update_success
+        if changed is None:
+            super().async_update_listeners()
+            return
+        # Filtering reads DataUpdateCoordinator._listeners, which maps each
+        # remove callback to (update_callback, context) in Home Assistant
+        # 2024.1 (the minimum supported release) and later
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    async def async_restore(self) -> None:
+        """Load the slow-tier data saved before the last restart.
+
+        Tiers whose saved deadline has not passed yet are served from the
+        restored data, so the first refresh after a restart only requests
+        what is actually due.
+        """
+        try:
+            if not (stored := await self._store.async_load()):
+                return
+            restored = HomevoltData(
+                status=(
+                    HomevoltStatusResponse.from_dict(stored["status"])
+                    if stored["status"] is not None
+                    else None
+                ),
+                error_report=[
+                    ErrorReportEntry.from_dict(e) for e in stored["error_report"]
+                ],
+                nodes=tuple(map(NodeInfo.from_dict, stored["nodes"])),
+                node_metrics={
+                    int(node_id): NodeMetrics.from_dict(metrics)
+                    for node_id, metrics in stored["node_metrics"].items()
+                },
+                schedule=(
+                    ScheduleData.from_dict(stored["schedule"])
+                    if stored["schedule"] is not None
+                    else None
+                ),
+            )
+            due = dict(stored["due"])
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            # A malformed cache only costs a fetch
+            _LOGGER.debug("Ignoring unreadable stored data: %s", err)
+            return
+
+        # Deadlines are stored as wall-clock times
+        wall, now = time(), monotonic()
+        for tier, due_at in due.items():
+            if tier in self._next_due and due_at > wall:
+                self._next_due[tier] = now + due_at - wall
+        self._restored = restored
+
+    def _data_to_store(self, data: HomevoltData) -> dict[str, Any]:
+        """Return the slow-tier data and deadlines to persist."""
+        wall, now = time(), monotonic()
+        return {
+            "due": {tier: wall + due - now for tier, due in self._next_due.items()},
+            "status": to_dict(data.status),
+            "error_report": to_dict(data.error_report),
+            "nodes": to_dict(data.nodes),
+            "node_metrics": {
+                str(node_id): _node_metrics_to_store(metrics)
+                for node_id, metrics in data.node_metrics.items()
+            },
+            "schedule": to_dict(data.schedule),
+        }
+
+    def _configured_node_ids(self, sensors: Sequence[SensorData]) -> tuple[int, ...]:
+        """Return the node ids of configured CT clamps (non-zero EUID)."""
+        sig = tuple((sensor.euid, sensor.node_id) for sensor in sensors)
+        if sig != self._ct_sensor_sig:
+            self._ct_sensor_sig = sig
+            self._ct_node_ids = tuple(
+                node_id
+                for euid, node_id in sig
+                if euid and euid != UNCONFIGURED_EUID and node_id
+            )
+        return self._ct_node_ids
+
+    async def _async_fetch_node_metrics(
+        self, node_ids: Sequence[int]
+    ) -> dict[int, NodeMetrics]:
+        """Fetch metrics for the given nodes, a bounded number at a time."""
+        sem = asyncio.Semaphore(NODE_METRICS_CONCURRENCY)
+
+        async def fetch(node_id: int) -> NodeMetrics:
+            async with sem:
+                return await self.client.async_get_node_metrics(node_id)
+
+        results = await asyncio.gather(
+            *(fetch(node_id) for node_id in node_ids), return_exceptions=True
+        )
+        node_metrics: dict[int, NodeMetrics] = {}
+        for node_id, metrics in zip(node_ids, results):
+            if isinstance(metrics, BaseException):
+                _LOGGER.warning("Failed to fetch node_metrics for node %s", node_id)
+            else:
+                node_metrics[node_id] = metrics
+        return node_metrics
+
+    def _adapt_interval(self, changed: bool) -> None:
+        """Back off polling while EMS data is unchanged, reset on change."""
+        if changed:
+            self.update_interval = self._base_interval
+        else:
+            self.update_interval = min(self.update_interval * 2, self._max_interval)
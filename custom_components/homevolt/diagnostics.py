@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
+import orjson
 
 from .coordinator import HomevoltCoordinator
+from .models import payload_fields
 
-REDACT_KEYS = {CONF_PASSWORD, "serial_number", "ssid", "psk", "ip", "mqtt_topic", "mqtt_topic_sub", "mqtt_client_id"}
+REDACT_KEYS = frozenset(
+    {CONF_PASSWORD, "serial_number", "ssid", "psk", "ip", "mqtt_topic", "mqtt_topic_sub", "mqtt_client_id"}
+)
+
+
+def _to_plain(obj: Any) -> Any:
+    """Convert models to plain data in one orjson round trip.
+
+    Dataclasses are passed to payload_fields so the output has the same
+    shape as models.to_dict, without the derived fields.
+    """
+    return orjson.loads(
+        orjson.dumps(
+            obj, default=payload_fields, option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    )
 
 
 async def async_get_config_entry_diagnostics(
@@ -21,32 +37,34 @@ async def async_get_config_entry_diagnostics(
     coordinator: HomevoltCoordinator = entry.runtime_data
 
     # Redact sensitive config data
-    config_data = dict(entry.data)
-    for key in REDACT_KEYS:
-        if key in config_data:
-            config_data[key] = "**REDACTED**"
+    config_data = {
+        key: "**REDACTED**" if key in REDACT_KEYS else value
+        for key, value in entry.data.items()
+    }
 
     diag: dict[str, Any] = {
         "config": config_data,
         "options": dict(entry.options),
     }
 
-    if coordinator.data:
-        diag["ems"] = asdict(coordinator.data.ems)
-        if coordinator.data.status:
-            status_dict = asdict(coordinator.data.status)
-            # Redact WiFi credentials
-            if "wifi_status" in status_dict:
-                status_dict["wifi_status"]["ssid"] = "**REDACTED**"
-                status_dict["wifi_status"]["ip"] = "**REDACTED**"
-            diag["status"] = status_dict
-        if coordinator.data.error_report:
-            diag["error_report"] = [asdict(e) for e in coordinator.data.error_report]
-        if coordinator.data.nodes:
-            diag["nodes"] = [asdict(n) for n in coordinator.data.nodes]
-        if coordinator.data.node_metrics:
-            diag["node_metrics"] = {
-                str(k): asdict(v) for k, v in coordinator.data.node_metrics.items()
+    if data := coordinator.data:
+        # Collect the models and convert them in a single pass
+        models: dict[str, Any] = {"ems": data.ems}
+        if data.status:
+            models["status"] = data.status
+        if data.error_report:
+            models["error_report"] = data.error_report
+        if data.nodes:
+            models["nodes"] = data.nodes
+        if data.node_metrics:
+            models["node_metrics"] = {
+                str(k): v for k, v in data.node_metrics.items()
             }
+        diag.update(_to_plain(models))
+
+        # Redact WiFi credentials
+        if "status" in diag:
+            diag["status"]["wifi_status"]["ssid"] = "**REDACTED**"
+            diag["status"]["wifi_status"]["ip"] = "**REDACTED**"
 
     return diag
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -9,14 +13,42 @@ from .const import DOMAIN, MANUFACTURER
 from .coordinator import HomevoltCoordinator
 
 
+def optional_attr(path: str) -> Callable[[Any], Any]:
+    """Return a value_fn for a dotted path whose first attribute may be None.
+
+    Only that parent (e.g. ``status`` before it is first fetched) reads as
+    None; a missing attribute anywhere on the path still raises.
+    """
+    parent, _, rest = path.partition(".")
+    get_parent = attrgetter(parent)
+    get_rest = attrgetter(rest)
+
+    def value_fn(obj: Any) -> Any:
+        value = get_parent(obj)
+        if value is None:
+            return None
+        return get_rest(value)
+
+    return value_fn
+
+
 class HomevoltEntity(CoordinatorEntity[HomevoltCoordinator]):
     """Base entity for Homevolt integration."""
 
     has_entity_name = True
 
-    def __init__(self, coordinator: HomevoltCoordinator, ecu_id: str) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: HomevoltCoordinator,
+        ecu_id: str,
+        tier: str | None = None,
+    ) -> None:
+        """Initialize the entity.
+
+        ``tier`` names the polling tier the entity's state comes from; the
+        entity is then only updated on refreshes where that tier changed.
+        """
+        super().__init__(coordinator, tier)
         self._ecu_id = ecu_id
 
     @property
@@ -78,9 +110,10 @@ class HomevoltSensorDeviceEntity(CoordinatorEntity[HomevoltCoordinator]):
         sensor_index: int,
         sensor_type: str,
         euid: str,
+        tier: str | None = None,
     ) -> None:
         """Initialize the sensor device entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, tier)
         self._ecu_id = ecu_id
         self._sensor_index = sensor_index
         self._sensor_type = sensor_type
@@ -90,11 +123,9 @@ class HomevoltSensorDeviceEntity(CoordinatorEntity[HomevoltCoordinator]):
     def device_info(self) -> DeviceInfo:
         """Return device information for the CT sensor."""
         sw_version = None
-        if self.coordinator.data and self.coordinator.data.nodes:
-            node = next(
-                (n for n in self.coordinator.data.nodes if n.eui == self._euid),
-                None,
-            )
+        data = self.coordinator.data
+        if data and data.nodes:
+            node = data.nodes_by_eui.get(self._euid)
             if node:
                 sw_version = node.version
         return DeviceInfo(
@@ -2,10 +2,133 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from datetime import UTC, datetime
+import sys
+from typing import Any, ClassVar, TypeVar
+
+_T = TypeVar("_T")
+
+
+def _from_dict(
+    keys: dict[str, str] | None = None, **nested: Callable[[Any], Any] | list[type]
+) -> Callable[[type[_T]], type[_T]]:
+    """Generate a ``from_dict`` classmethod from the dataclass fields.
+
+    Every field is read from the key of the same name (or the one given in
+    ``keys``), falling back to its default. ``nested`` maps a field to the
+    model its value is parsed with, a one-element list for a sequence of
+    models (a tuple unless the field defaults to a list), or a plain
+    converter applied to the value. The builder is compiled once
+    per class, so parsing runs a single flat constructor call.
+    """
+    keys = keys or {}
+
+    def wrap(cls: type[_T]) -> type[_T]:
+        ns: dict[str, Any] = {"_empty": {}}
+        args = []
+        for f in fields(cls):
+            if not f.init:
+                continue
+            name = f.name
+            key = keys.get(name, name)
+            model = nested.get(name)
+            if f.default_factory is not MISSING:
+                ns[f"_f_{name}"] = f.default_factory
+                default = f"_f_{name}()"
+            else:
+                ns[f"_d_{name}"] = f.default
+                default = f"_d_{name}"
+            if isinstance(model, list):
+                ns[f"_m_{name}"] = model[0].from_dict
+                if f.default_factory is list:
+                    expr = f"[_m_{name}(v) for v in g({key!r}, ())]"
+                else:
+                    expr = f"tuple(map(_m_{name}, g({key!r}, ())))"
+            elif is_dataclass(model):
+                ns[f"_m_{name}"] = model.from_dict
+                expr = f"_m_{name}(g({key!r}, _empty))"
+            elif model is not None:
+                ns[f"_c_{name}"] = model
+                expr = f"_c_{name}(g({key!r}, {default}))"
+            elif f.default_factory is not MISSING:
+                expr = f"d[{key!r}] if {key!r} in d else {default}"
+            else:
+                expr = f"g({key!r}, {default})"
+            args.append(f"{name}={expr}")
+        exec(
+            f"def from_dict(cls, d):\n    g = d.get\n    return cls({', '.join(args)})",
+            ns,
+        )
+        cls.from_dict = classmethod(ns["from_dict"])
+        return cls
+
+    return wrap
+
+
+def _intern(value: Any) -> Any:
+    """Intern a low-cardinality string so repeated polls share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_list(values: Any) -> Any:
+    """Intern every string in a list of state names."""
+    if not isinstance(values, list):
+        return values
+    return [_intern(v) for v in values]
+
+
+def _join(values: list[str]) -> str | None:
+    """Join flag strings for display, None for an empty list."""
+    return ", ".join(values) if values else None
+
+
+def _iso_utc(ts: Any) -> str:
+    """Format a Unix timestamp as ISO 8601 UTC, empty if it is not a valid time."""
+    try:
+        return datetime.fromtimestamp(ts, tz=UTC).isoformat()
+    except (OverflowError, OSError, TypeError, ValueError):
+        return ""
+
+
+# Field names carried by the API payload, per model class
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _payload_names(cls: type) -> tuple[str, ...]:
+    """Return the names of the API fields of a model class."""
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = _FIELDS_CACHE[cls] = tuple(f.name for f in fields(cls) if f.init)
+    return names
+
+
+def payload_fields(obj: Any) -> dict[str, Any]:
+    """Return the API fields of one model as a dict, without converting values.
+
+    Derived ``init=False`` fields are left out, matching ``to_dict``; this is
+    the ``default`` hook for serializing models with orjson.
+    """
+    return {name: getattr(obj, name) for name in _payload_names(type(obj))}
 
 
-@dataclass
+def to_dict(obj: Any) -> Any:
+    """Convert a model tree to plain dicts and lists without deep-copying."""
+    if is_dataclass(obj):
+        return {
+            name: to_dict(getattr(obj, name)) for name in _payload_names(type(obj))
+        }
+    if isinstance(obj, (list, tuple)):
+        return [to_dict(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: to_dict(value) for key, value in obj.items()}
+    return obj
+
+
+@_from_dict()
+@dataclass(slots=True)
 class EmsInfo:
     """EMS system information."""
 
@@ -14,17 +137,9 @@ class EmsInfo:
     rated_capacity: int = 0  # Wh
     rated_power: int = 0  # W
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsInfo:
-        return cls(
-            protocol_version=data.get("protocol_version", 0),
-            fw_version=data.get("fw_version", ""),
-            rated_capacity=data.get("rated_capacity", 0),
-            rated_power=data.get("rated_power", 0),
-        )
 
-
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class BmsInfo:
     """Battery Management System info."""
 
@@ -33,32 +148,18 @@ class BmsInfo:
     rated_cap: int = 0  # Wh
     id: int = 0
 
-    @classmethod
-    def from_dict(cls, data: dict) -> BmsInfo:
-        return cls(
-            fw_version=data.get("fw_version", ""),
-            serial_number=data.get("serial_number", ""),
-            rated_cap=data.get("rated_cap", 0),
-            id=data.get("id", 0),
-        )
 
-
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class InvInfo:
     """Inverter information."""
 
     fw_version: str = ""
     serial_number: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict) -> InvInfo:
-        return cls(
-            fw_version=data.get("fw_version", ""),
-            serial_number=data.get("serial_number", ""),
-        )
-
 
-@dataclass
+@_from_dict(grid_code_preset_str=_intern)
+@dataclass(slots=True)
 class EmsConfig:
     """EMS configuration."""
 
@@ -66,16 +167,9 @@ class EmsConfig:
     grid_code_preset_str: str = ""
     control_timeout: bool = False
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsConfig:
-        return cls(
-            grid_code_preset=data.get("grid_code_preset", 0),
-            grid_code_preset_str=data.get("grid_code_preset_str", ""),
-            control_timeout=data.get("control_timeout", False),
-        )
-
 
-@dataclass
+@_from_dict(mode_sel_str=_intern)
+@dataclass(slots=True)
 class EmsControl:
     """EMS control state."""
 
@@ -83,20 +177,19 @@ class EmsControl:
     mode_sel_str: str = ""
     pwr_ref: int = 0
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsControl:
-        return cls(
-            mode_sel=data.get("mode_sel", 0),
-            mode_sel_str=data.get("mode_sel_str", ""),
-            pwr_ref=data.get("pwr_ref", 0),
-        )
-
 
-@dataclass
+@_from_dict(
+    state_str=_intern,
+    info_str=_intern_list,
+    warning_str=_intern_list,
+    alarm_str=_intern_list,
+)
+@dataclass(slots=True)
 class EmsData:
     """Real-time EMS data."""
 
-    timestamp_ms: int = 0
+    # Sample time, advanced on every response; not part of equality
+    timestamp_ms: int = field(default=0, compare=False)
     state: int = 0
     state_str: str = ""
     info: int = 0
@@ -117,35 +210,25 @@ class EmsData:
     avail_cap: int = 0  # Wh
     freq_res_state: int = 0
     soc_avg: int = 0  # centi-percent (divide by 100)
-
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsData:
-        return cls(
-            timestamp_ms=data.get("timestamp_ms", 0),
-            state=data.get("state", 0),
-            state_str=data.get("state_str", ""),
-            info=data.get("info", 0),
-            info_str=data.get("info_str", []),
-            warning=data.get("warning", 0),
-            warning_str=data.get("warning_str", []),
-            alarm=data.get("alarm", 0),
-            alarm_str=data.get("alarm_str", []),
-            phase_angle=data.get("phase_angle", 0),
-            frequency=data.get("frequency", 0),
-            phase_seq=data.get("phase_seq", 0),
-            power=data.get("power", 0),
-            apparent_power=data.get("apparent_power", 0),
-            reactive_power=data.get("reactive_power", 0),
-            energy_produced=data.get("energy_produced", 0),
-            energy_consumed=data.get("energy_consumed", 0),
-            sys_temp=data.get("sys_temp", 0),
-            avail_cap=data.get("avail_cap", 0),
-            freq_res_state=data.get("freq_res_state", 0),
-            soc_avg=data.get("soc_avg", 0),
-        )
-
-
-@dataclass
+    # Values in display units and comma-joined flag strings, set at parse time
+    soc_avg_pct: float = field(default=0.0, init=False, repr=False, compare=False)
+    sys_temp_c: float = field(default=0.0, init=False, repr=False, compare=False)
+    frequency_hz: float = field(default=0.0, init=False, repr=False, compare=False)
+    info_str_joined: str | None = field(default=None, init=False, repr=False, compare=False)
+    warning_str_joined: str | None = field(default=None, init=False, repr=False, compare=False)
+    alarm_str_joined: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.soc_avg_pct = self.soc_avg / 100
+        self.sys_temp_c = self.sys_temp / 10
+        self.frequency_hz = self.frequency / 1000
+        self.info_str_joined = _join(self.info_str)
+        self.warning_str_joined = _join(self.warning_str)
+        self.alarm_str_joined = _join(self.alarm_str)
+
+
+@_from_dict(state_str=_intern, alarm_str=_intern_list)
+@dataclass(slots=True)
 class BmsData:
     """Per-battery module data."""
 
@@ -158,23 +241,21 @@ class BmsData:
     alarm_str: list[str] = field(default_factory=list)
     tmin: int = 0  # decicelsius
     tmax: int = 0  # decicelsius
+    # Values in display units and comma-joined alarm strings, set at parse time
+    soc_pct: float = field(default=0.0, init=False, repr=False, compare=False)
+    tmin_c: float = field(default=0.0, init=False, repr=False, compare=False)
+    tmax_c: float = field(default=0.0, init=False, repr=False, compare=False)
+    alarm_str_joined: str | None = field(default=None, init=False, repr=False, compare=False)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> BmsData:
-        return cls(
-            energy_avail=data.get("energy_avail", 0),
-            cycle_count=data.get("cycle_count", 0),
-            soc=data.get("soc", 0),
-            state=data.get("state", 0),
-            state_str=data.get("state_str", ""),
-            alarm=data.get("alarm", 0),
-            alarm_str=data.get("alarm_str", []),
-            tmin=data.get("tmin", 0),
-            tmax=data.get("tmax", 0),
-        )
+    def __post_init__(self) -> None:
+        self.soc_pct = self.soc / 100
+        self.tmin_c = self.tmin / 10
+        self.tmax_c = self.tmax / 10
+        self.alarm_str_joined = _join(self.alarm_str)
 
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class EmsPrediction:
     """Available charge/discharge predictions."""
 
@@ -187,21 +268,9 @@ class EmsPrediction:
     avail_group_fuse_ch_pwr: int = 0  # W
     avail_group_fuse_di_pwr: int = 0  # W
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsPrediction:
-        return cls(
-            avail_ch_pwr=data.get("avail_ch_pwr", 0),
-            avail_di_pwr=data.get("avail_di_pwr", 0),
-            avail_ch_energy=data.get("avail_ch_energy", 0),
-            avail_di_energy=data.get("avail_di_energy", 0),
-            avail_inv_ch_pwr=data.get("avail_inv_ch_pwr", 0),
-            avail_inv_di_pwr=data.get("avail_inv_di_pwr", 0),
-            avail_group_fuse_ch_pwr=data.get("avail_group_fuse_ch_pwr", 0),
-            avail_group_fuse_di_pwr=data.get("avail_group_fuse_di_pwr", 0),
-        )
-
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class EmsVoltage:
     """Phase voltages (in decivolts, e.g. 2303 = 230.3V)."""
 
@@ -211,56 +280,72 @@ class EmsVoltage:
     l1_l2: int = 0
     l2_l3: int = 0
     l3_l1: int = 0
-
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsVoltage:
-        return cls(
-            l1=data.get("l1", 0),
-            l2=data.get("l2", 0),
-            l3=data.get("l3", 0),
-            l1_l2=data.get("l1_l2", 0),
-            l2_l3=data.get("l2_l3", 0),
-            l3_l1=data.get("l3_l1", 0),
-        )
-
-
-@dataclass
+    # Volts, set at parse time
+    l1_v: float = field(default=0.0, init=False, repr=False, compare=False)
+    l2_v: float = field(default=0.0, init=False, repr=False, compare=False)
+    l3_v: float = field(default=0.0, init=False, repr=False, compare=False)
+    l1_l2_v: float = field(default=0.0, init=False, repr=False, compare=False)
+    l2_l3_v: float = field(default=0.0, init=False, repr=False, compare=False)
+    l3_l1_v: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.l1_v = self.l1 / 10
+        self.l2_v = self.l2 / 10
+        self.l3_v = self.l3 / 10
+        self.l1_l2_v = self.l1_l2 / 10
+        self.l2_l3_v = self.l2_l3 / 10
+        self.l3_l1_v = self.l3_l1 / 10
+
+
+@_from_dict()
+@dataclass(slots=True)
 class EmsCurrent:
     """Phase currents (in deciamps)."""
 
     l1: int = 0
     l2: int = 0
     l3: int = 0
+    # Amps, set at parse time
+    l1_a: float = field(default=0.0, init=False, repr=False, compare=False)
+    l2_a: float = field(default=0.0, init=False, repr=False, compare=False)
+    l3_a: float = field(default=0.0, init=False, repr=False, compare=False)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsCurrent:
-        return cls(
-            l1=data.get("l1", 0),
-            l2=data.get("l2", 0),
-            l3=data.get("l3", 0),
-        )
+    def __post_init__(self) -> None:
+        self.l1_a = self.l1 / 10
+        self.l2_a = self.l2 / 10
+        self.l3_a = self.l3 / 10
 
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class EmsAggregate:
     """Aggregated energy data."""
 
     imported_kwh: float = 0.0
     exported_kwh: float = 0.0
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsAggregate:
-        return cls(
-            imported_kwh=data.get("imported_kwh", 0.0),
-            exported_kwh=data.get("exported_kwh", 0.0),
-        )
-
 
-@dataclass
+@_from_dict(
+    ecu_id=str,
+    error_str=_intern,
+    op_state_str=_intern,
+    ems_info=EmsInfo,
+    bms_info=[BmsInfo],
+    inv_info=InvInfo,
+    ems_config=EmsConfig,
+    ems_control=EmsControl,
+    ems_data=EmsData,
+    bms_data=[BmsData],
+    ems_prediction=EmsPrediction,
+    ems_voltage=EmsVoltage,
+    ems_current=EmsCurrent,
+    ems_aggregate=EmsAggregate,
+)
+@dataclass(slots=True)
 class EmsDevice:
     """A single EMS device (inverter + batteries)."""
 
-    ecu_id: int = 0
+    ecu_id: str = "0"
     ecu_host: str = ""
     ecu_version: str = ""
     error: int = 0
@@ -273,39 +358,16 @@ class EmsDevice:
     ems_config: EmsConfig = field(default_factory=EmsConfig)
     ems_control: EmsControl = field(default_factory=EmsControl)
     ems_data: EmsData = field(default_factory=EmsData)
-    bms_data: list[BmsData] = field(default_factory=list)
+    bms_data: tuple[BmsData, ...] = ()
     ems_prediction: EmsPrediction = field(default_factory=EmsPrediction)
     ems_voltage: EmsVoltage = field(default_factory=EmsVoltage)
     ems_current: EmsCurrent = field(default_factory=EmsCurrent)
     ems_aggregate: EmsAggregate = field(default_factory=EmsAggregate)
     error_cnt: int = 0
 
-    @classmethod
-    def from_dict(cls, data: dict) -> EmsDevice:
-        return cls(
-            ecu_id=data.get("ecu_id", 0),
-            ecu_host=data.get("ecu_host", ""),
-            ecu_version=data.get("ecu_version", ""),
-            error=data.get("error", 0),
-            error_str=data.get("error_str", ""),
-            op_state=data.get("op_state", 0),
-            op_state_str=data.get("op_state_str", ""),
-            ems_info=EmsInfo.from_dict(data.get("ems_info", {})),
-            bms_info=[BmsInfo.from_dict(b) for b in data.get("bms_info", [])],
-            inv_info=InvInfo.from_dict(data.get("inv_info", {})),
-            ems_config=EmsConfig.from_dict(data.get("ems_config", {})),
-            ems_control=EmsControl.from_dict(data.get("ems_control", {})),
-            ems_data=EmsData.from_dict(data.get("ems_data", {})),
-            bms_data=[BmsData.from_dict(b) for b in data.get("bms_data", [])],
-            ems_prediction=EmsPrediction.from_dict(data.get("ems_prediction", {})),
-            ems_voltage=EmsVoltage.from_dict(data.get("ems_voltage", {})),
-            ems_current=EmsCurrent.from_dict(data.get("ems_current", {})),
-            ems_aggregate=EmsAggregate.from_dict(data.get("ems_aggregate", {})),
-            error_cnt=data.get("error_cnt", 0),
-        )
-
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class PhaseData:
     """Per-phase CT clamp measurement."""
 
@@ -314,17 +376,9 @@ class PhaseData:
     power: float = 0.0
     pf: float = 0.0  # power factor
 
-    @classmethod
-    def from_dict(cls, data: dict) -> PhaseData:
-        return cls(
-            voltage=data.get("voltage", 0.0),
-            amp=data.get("amp", 0.0),
-            power=data.get("power", 0.0),
-            pf=data.get("pf", 0.0),
-        )
-
 
-@dataclass
+@_from_dict(type=_intern, phase=[PhaseData])
+@dataclass(slots=True)
 class SensorData:
     """CT clamp sensor data (grid, solar, load)."""
 
@@ -341,52 +395,30 @@ class SensorData:
     total_power: int = 0  # W
     energy_imported: float = 0.0  # kWh
     energy_exported: float = 0.0  # kWh
-    timestamp: int = 0
-    timestamp_str: str = ""
-
-    @classmethod
-    def from_dict(cls, data: dict) -> SensorData:
-        return cls(
-            type=data.get("type", ""),
-            node_id=data.get("node_id", 0),
-            euid=data.get("euid", ""),
-            interface=data.get("interface", 0),
-            available=data.get("available", False),
-            rssi=data.get("rssi", 0.0),
-            average_rssi=data.get("average_rssi", 0.0),
-            pdr=data.get("pdr", 0.0),
-            phase=[PhaseData.from_dict(p) for p in data.get("phase", [])],
-            frequency=data.get("frequency", 0.0),
-            total_power=data.get("total_power", 0),
-            energy_imported=data.get("energy_imported", 0.0),
-            energy_exported=data.get("energy_exported", 0.0),
-            timestamp=data.get("timestamp", 0),
-            timestamp_str=data.get("timestamp_str", ""),
-        )
+    # Reading time, not part of equality
+    timestamp: int = field(default=0, compare=False)
+    timestamp_str: str = field(default="", compare=False)
 
 
-@dataclass
+@_from_dict(
+    {"type": "$type"}, ems=[EmsDevice], aggregated=EmsDevice, sensors=[SensorData]
+)
+@dataclass(slots=True)
 class HomevoltEmsResponse:
     """Top-level response from /ems.json."""
 
     type: str = ""
-    ts: int = 0
+    # Response time, advanced on every poll; not part of equality
+    ts: int = field(default=0, compare=False)
     ems: list[EmsDevice] = field(default_factory=list)
     aggregated: EmsDevice = field(default_factory=EmsDevice)
-    sensors: list[SensorData] = field(default_factory=list)
-
-    @classmethod
-    def from_dict(cls, data: dict) -> HomevoltEmsResponse:
-        return cls(
-            type=data.get("$type", ""),
-            ts=data.get("ts", 0),
-            ems=[EmsDevice.from_dict(e) for e in data.get("ems", [])],
-            aggregated=EmsDevice.from_dict(data.get("aggregated", {})),
-            sensors=[SensorData.from_dict(s) for s in data.get("sensors", [])],
-        )
+    sensors: tuple[SensorData, ...] = ()
+    # Set by the API client when this is a cached copy served after a failure
+    is_stale: bool = field(default=False, compare=False)
 
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class WifiStatus:
     """WiFi status from /status.json."""
 
@@ -396,33 +428,18 @@ class WifiStatus:
     rssi: int = 0
     connected: bool = False
 
-    @classmethod
-    def from_dict(cls, data: dict) -> WifiStatus:
-        return cls(
-            wifi_mode=data.get("wifi_mode", ""),
-            ip=data.get("ip", ""),
-            ssid=data.get("ssid", ""),
-            rssi=data.get("rssi", 0),
-            connected=data.get("connected", False),
-        )
-
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class MqttStatus:
     """MQTT status from /status.json."""
 
     connected: bool = False
     subscribed: bool = False
 
-    @classmethod
-    def from_dict(cls, data: dict) -> MqttStatus:
-        return cls(
-            connected=data.get("connected", False),
-            subscribed=data.get("subscribed", False),
-        )
 
-
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class LteStatus:
     """LTE status from /status.json."""
 
@@ -431,32 +448,23 @@ class LteStatus:
     rssi_db: int = 0
     pdp_active: bool = False
 
-    @classmethod
-    def from_dict(cls, data: dict) -> LteStatus:
-        return cls(
-            operator_name=data.get("operator_name", ""),
-            band=data.get("band", ""),
-            rssi_db=data.get("rssi_db", 0),
-            pdp_active=data.get("pdp_active", False),
-        )
 
-
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class FirmwareInfo:
     """Firmware versions from /status.json."""
 
     esp: str = ""
     efr: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict) -> FirmwareInfo:
-        return cls(
-            esp=data.get("esp", ""),
-            efr=data.get("efr", ""),
-        )
 
-
-@dataclass
+@_from_dict(
+    firmware=FirmwareInfo,
+    wifi_status=WifiStatus,
+    mqtt_status=MqttStatus,
+    lte_status=LteStatus,
+)
+@dataclass(slots=True)
 class HomevoltStatusResponse:
     """Response from /status.json."""
 
@@ -466,18 +474,11 @@ class HomevoltStatusResponse:
     mqtt_status: MqttStatus = field(default_factory=MqttStatus)
     lte_status: LteStatus = field(default_factory=LteStatus)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> HomevoltStatusResponse:
-        return cls(
-            up_time=data.get("up_time", 0),
-            firmware=FirmwareInfo.from_dict(data.get("firmware", {})),
-            wifi_status=WifiStatus.from_dict(data.get("wifi_status", {})),
-            mqtt_status=MqttStatus.from_dict(data.get("mqtt_status", {})),
-            lte_status=LteStatus.from_dict(data.get("lte_status", {})),
-        )
-
 
-@dataclass
+@_from_dict(
+    sub_system_name=_intern, error_name=_intern, activated=_intern
+)
+@dataclass(slots=True)
 class ErrorReportEntry:
     """Single entry from /error_report.json."""
 
@@ -485,24 +486,12 @@ class ErrorReportEntry:
     sub_system_name: str = ""
     error_id: int = 0
     error_name: str = ""
-    activated: str = ""  # "ok", "warning", "error", "unknown"
+    activated: str = ""  # "ok", "warning", "error", "unknown" (interned)
     message: str = ""
     details: list[str] = field(default_factory=list)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> ErrorReportEntry:
-        return cls(
-            sub_system_id=data.get("sub_system_id", 0),
-            sub_system_name=data.get("sub_system_name", ""),
-            error_id=data.get("error_id", 0),
-            error_name=data.get("error_name", ""),
-            activated=data.get("activated", ""),
-            message=data.get("message", ""),
-            details=data.get("details", []),
-        )
-
 
-@dataclass
+@dataclass(slots=True)
 class NodeMetrics:
     """Metrics for a CT clamp mesh node from /node_metrics.json."""
 
@@ -528,7 +517,8 @@ class NodeMetrics:
         )
 
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class NodeInfo:
     """Node info from /nodes.json."""
 
@@ -540,20 +530,9 @@ class NodeInfo:
     ota_distribute_status: str = ""
     manifest_version: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict) -> NodeInfo:
-        return cls(
-            node_id=data.get("node_id", 0),
-            eui=data.get("eui", ""),
-            version=data.get("version", ""),
-            model=data.get("model", ""),
-            available=data.get("available", False),
-            ota_distribute_status=data.get("ota_distribute_status", ""),
-            manifest_version=data.get("manifest_version", ""),
-        )
-
 
-@dataclass
+@_from_dict()
+@dataclass(slots=True)
 class ScheduleEntry:
     """A single schedule time slot."""
 
@@ -563,63 +542,146 @@ class ScheduleEntry:
     type: int = 0
     setpoint: int = 0
     main_fuse: int = 0
-
-    TYPE_NAMES: dict[int, str] = field(
-        default_factory=lambda: {
-            0: "Idle",
-            1: "Charging",
-            2: "Discharging",
-            3: "Grid Charge",
-            4: "Grid Discharge",
-            5: "Grid Charge/Discharge",
-            6: "Frequency Reserve",
-        },
-        repr=False,
-        compare=False,
-    )
-
-    @classmethod
-    def from_dict(cls, data: dict) -> ScheduleEntry:
-        return cls(
-            id=data.get("id", 0),
-            from_ts=data.get("from_ts", 0),
-            to_ts=data.get("to_ts", 0),
-            type=data.get("type", 0),
-            setpoint=data.get("setpoint", 0),
-            main_fuse=data.get("main_fuse", 0),
-        )
+    # Slot bounds as ISO 8601 UTC strings, formatted once at parse time
+    from_iso: str = field(default="", init=False, repr=False, compare=False)
+    to_iso: str = field(default="", init=False, repr=False, compare=False)
+
+    TYPE_NAMES: ClassVar[dict[int, str]] = {
+        0: "Idle",
+        1: "Charging",
+        2: "Discharging",
+        3: "Grid Charge",
+        4: "Grid Discharge",
+        5: "Grid Charge/Discharge",
+        6: "Frequency Reserve",
+    }
+
+    def __post_init__(self) -> None:
+        self.from_iso = _iso_utc(self.from_ts)
+        self.to_iso = _iso_utc(self.to_ts)
 
     @property
     def type_name(self) -> str:
         return self.TYPE_NAMES.get(self.type, f"Unknown ({self.type})")
 
 
-@dataclass
+@_from_dict(entries=[ScheduleEntry])
+@dataclass(slots=True)
 class ScheduleData:
     """Schedule response from /schedule.json."""
 
     local_mode: bool = False
     schedule_id: str = ""
     entries: list[ScheduleEntry] = field(default_factory=list)
+    # Entries ordered by start time with their start times, for bisection
+    _ordered: list[ScheduleEntry] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _ordered_from_ts: list[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _ordered_for: list[ScheduleEntry] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Current/next lookup, reused until the second or the entries change
+    _cached_now_ts: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_current: ScheduleEntry | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_next: ScheduleEntry | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Attribute form of ``entries``, rebuilt whenever the list is replaced
+    _entry_attrs: list[dict[str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _entry_attrs_for: list[ScheduleEntry] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    @classmethod
-    def from_dict(cls, data: dict) -> ScheduleData:
-        return cls(
-            local_mode=data.get("local_mode", False),
-            schedule_id=data.get("schedule_id", ""),
-            entries=[
-                ScheduleEntry.from_dict(e) for e in data.get("entries", [])
-            ],
-        )
-
+    def entries_at(self, now: int) -> tuple[ScheduleEntry | None, ScheduleEntry | None]:
+        """Return the entry covering ``now`` and the next entry with a different action."""
+        if self._ordered_for is not self.entries:
+            self._ordered = sorted(self.entries, key=lambda e: e.from_ts)
+            self._ordered_from_ts = [e.from_ts for e in self._ordered]
+            self._ordered_for = self.entries
+            self._cached_now_ts = None
+        if self._cached_now_ts != now:
+            ordered = self._ordered
+            idx = bisect_right(self._ordered_from_ts, now) - 1
+            current = ordered[idx] if idx >= 0 and now < ordered[idx].to_ts else None
+            upcoming = None
+            cur_type, cur_setpoint = (
+                (current.type, current.setpoint) if current is not None else (None, None)
+            )
+            for idx in range(bisect_left(self._ordered_from_ts, now), len(ordered)):
+                entry = ordered[idx]
+                if current is None or entry.type != cur_type or entry.setpoint != cur_setpoint:
+                    upcoming = entry
+                    break
+            self._cached_current = current
+            self._cached_next = upcoming
+            self._cached_now_ts = now
+        return self._cached_current, self._cached_next
 
-@dataclass
+    @property
+    def entry_attrs(self) -> list[dict[str, Any]]:
+        """Return the entries as plain dicts for state attributes."""
+        if self._entry_attrs_for is not self.entries:
+            self._entry_attrs = [
+                {
+                    "from": e.from_iso,
+                    "to": e.to_iso,
+                    "type": e.type_name,
+                    "setpoint": e.setpoint,
+                }
+                for e in self.entries
+            ]
+            self._entry_attrs_for = self.entries
+        return self._entry_attrs
+
+
+@dataclass(slots=True)
 class HomevoltData:
     """Combined data from all API endpoints."""
 
     ems: HomevoltEmsResponse = field(default_factory=HomevoltEmsResponse)
     status: HomevoltStatusResponse | None = None
     error_report: list[ErrorReportEntry] = field(default_factory=list)
-    nodes: list[NodeInfo] = field(default_factory=list)
+    nodes: tuple[NodeInfo, ...] = ()
     node_metrics: dict[int, NodeMetrics] = field(default_factory=dict)
     schedule: ScheduleData | None = None
+    # Indexes over ``nodes``, rebuilt whenever the list is replaced
+    _nodes_by_id: dict[int, NodeInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nodes_by_eui: dict[str, NodeInfo] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nodes_indexed: tuple[NodeInfo, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _index_nodes(self) -> None:
+        """Rebuild the node indexes if ``nodes`` has been replaced."""
+        if self._nodes_indexed is not self.nodes:
+            self._nodes_by_id = {node.node_id: node for node in self.nodes}
+            self._nodes_by_eui = {}
+            for node in self.nodes:
+                # First match wins, as with a linear scan
+                self._nodes_by_eui.setdefault(node.eui, node)
+            self._nodes_indexed = self.nodes
+
+    @property
+    def nodes_by_id(self) -> dict[int, NodeInfo]:
+        """Return nodes keyed by node_id."""
+        self._index_nodes()
+        return self._nodes_by_id
+
+    @property
+    def nodes_by_eui(self) -> dict[str, NodeInfo]:
+        """Return nodes keyed by EUI."""
+        self._index_nodes()
+        return self._nodes_by_eui
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 import logging
+from operator import attrgetter
+import sys
+from time import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -33,11 +36,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
+from .const import UNCONFIGURED_EUID
 from .coordinator import HomevoltCoordinator
-from .entity import HomevoltBmsEntity, HomevoltEntity, HomevoltSensorDeviceEntity
+from .entity import (
+    HomevoltBmsEntity,
+    HomevoltEntity,
+    HomevoltSensorDeviceEntity,
+    optional_attr,
+)
 from .models import (
     BmsData,
-    EmsDevice,
     ErrorReportEntry,
     HomevoltData,
     NodeInfo,
@@ -54,47 +62,17 @@ _LOGGER = logging.getLogger(__name__)
 # Custom sensor entity description
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True)
 class HomevoltSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt sensor entity."""
-
-    value_fn: Callable[[EmsDevice], StateType] | None = None
-
-
-@dataclass(frozen=True)
-class HomevoltBmsSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt BMS sensor entity."""
-
-    value_fn: Callable[[BmsData], StateType] | None = None
-
-
-@dataclass(frozen=True)
-class HomevoltCtSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt CT clamp sensor entity."""
-
-    value_fn: Callable[[SensorData], StateType] | None = None
-
-
-@dataclass(frozen=True)
-class HomevoltStatusSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt status sensor entity."""
-
-    value_fn: Callable[[HomevoltData], StateType] | None = None
-
+    """Describes a Homevolt sensor entity.
 
-@dataclass(frozen=True)
-class HomevoltScheduleSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt schedule sensor entity."""
+    ``value_fn`` and ``attr_fn`` take whatever the owning entity class reads
+    from the coordinator snapshot: an EMS device, a BMS module, a CT clamp,
+    the combined data, the schedule, or CT node metrics and node info.
+    """
 
-    value_fn: Callable[[ScheduleData | None], StateType] | None = None
-    attr_fn: Callable[[ScheduleData | None], dict[str, Any] | None] | None = None
-
-
-@dataclass(frozen=True)
-class HomevoltCtNodeSensorEntityDescription(SensorEntityDescription):
-    """Describes a Homevolt CT node sensor entity."""
-
-    value_fn: Callable[[NodeMetrics | None, NodeInfo | None], StateType] | None = None
+    value_fn: Callable[..., StateType]
+    attr_fn: Callable[..., dict[str, Any] | None] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -106,13 +84,13 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         key="battery_status",
         translation_key="battery_status",
         device_class=SensorDeviceClass.ENUM,
-        value_fn=lambda agg: agg.op_state_str,
+        value_fn=attrgetter("op_state_str"),
     ),
     HomevoltSensorEntityDescription(
         key="battery_state",
         translation_key="battery_state",
         device_class=SensorDeviceClass.ENUM,
-        value_fn=lambda agg: agg.ems_data.state_str,
+        value_fn=attrgetter("ems_data.state_str"),
     ),
     HomevoltSensorEntityDescription(
         key="battery_soc",
@@ -121,7 +99,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_data.soc_avg / 100,
+        value_fn=attrgetter("ems_data.soc_avg_pct"),
     ),
     HomevoltSensorEntityDescription(
         key="battery_power",
@@ -129,7 +107,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda agg: agg.ems_data.power,
+        value_fn=attrgetter("ems_data.power"),
     ),
     HomevoltSensorEntityDescription(
         key="apparent_power",
@@ -137,7 +115,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.APPARENT_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-        value_fn=lambda agg: agg.ems_data.apparent_power,
+        value_fn=attrgetter("ems_data.apparent_power"),
     ),
     HomevoltSensorEntityDescription(
         key="reactive_power",
@@ -145,7 +123,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
-        value_fn=lambda agg: agg.ems_data.reactive_power,
+        value_fn=attrgetter("ems_data.reactive_power"),
     ),
     HomevoltSensorEntityDescription(
         key="system_temperature",
@@ -154,7 +132,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_data.sys_temp / 10,
+        value_fn=attrgetter("ems_data.sys_temp_c"),
     ),
     HomevoltSensorEntityDescription(
         key="grid_frequency",
@@ -163,7 +141,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         suggested_display_precision=3,
-        value_fn=lambda agg: agg.ems_data.frequency / 1000,
+        value_fn=attrgetter("ems_data.frequency_hz"),
     ),
     HomevoltSensorEntityDescription(
         key="energy_produced",
@@ -171,7 +149,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda agg: agg.ems_data.energy_produced,
+        value_fn=attrgetter("ems_data.energy_produced"),
     ),
     HomevoltSensorEntityDescription(
         key="energy_consumed",
@@ -179,7 +157,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda agg: agg.ems_data.energy_consumed,
+        value_fn=attrgetter("ems_data.energy_consumed"),
     ),
     HomevoltSensorEntityDescription(
         key="energy_imported",
@@ -187,7 +165,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda agg: agg.ems_aggregate.imported_kwh,
+        value_fn=attrgetter("ems_aggregate.imported_kwh"),
     ),
     HomevoltSensorEntityDescription(
         key="energy_exported",
@@ -195,7 +173,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda agg: agg.ems_aggregate.exported_kwh,
+        value_fn=attrgetter("ems_aggregate.exported_kwh"),
     ),
     HomevoltSensorEntityDescription(
         key="available_charge_power",
@@ -203,7 +181,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda agg: agg.ems_prediction.avail_ch_pwr,
+        value_fn=attrgetter("ems_prediction.avail_ch_pwr"),
     ),
     HomevoltSensorEntityDescription(
         key="available_discharge_power",
@@ -211,7 +189,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda agg: agg.ems_prediction.avail_di_pwr,
+        value_fn=attrgetter("ems_prediction.avail_di_pwr"),
     ),
     HomevoltSensorEntityDescription(
         key="available_charge_energy",
@@ -219,7 +197,7 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda agg: agg.ems_prediction.avail_ch_energy,
+        value_fn=attrgetter("ems_prediction.avail_ch_energy"),
     ),
     HomevoltSensorEntityDescription(
         key="available_discharge_energy",
@@ -227,28 +205,28 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda agg: agg.ems_prediction.avail_di_energy,
+        value_fn=attrgetter("ems_prediction.avail_di_energy"),
     ),
     HomevoltSensorEntityDescription(
         key="rated_capacity",
         translation_key="rated_capacity",
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda agg: agg.ems_info.rated_capacity,
+        value_fn=attrgetter("ems_info.rated_capacity"),
     ),
     HomevoltSensorEntityDescription(
         key="rated_power",
         translation_key="rated_power",
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda agg: agg.ems_info.rated_power,
+        value_fn=attrgetter("ems_info.rated_power"),
     ),
     HomevoltSensorEntityDescription(
         key="phase_angle",
         translation_key="phase_angle",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="°",
-        value_fn=lambda agg: agg.ems_data.phase_angle,
+        value_fn=attrgetter("ems_data.phase_angle"),
     ),
 )
 
@@ -257,61 +235,17 @@ SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
 # Voltage sensors
 # ---------------------------------------------------------------------------
 
-VOLTAGE_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
-    HomevoltSensorEntityDescription(
-        key="voltage_l1",
-        translation_key="voltage_l1",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l1 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="voltage_l2",
-        translation_key="voltage_l2",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l2 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="voltage_l3",
-        translation_key="voltage_l3",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l3 / 10,
-    ),
+VOLTAGE_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = tuple(
     HomevoltSensorEntityDescription(
-        key="voltage_l1_l2",
-        translation_key="voltage_l1_l2",
+        key=sys.intern(f"voltage_{phase}"),
+        translation_key=sys.intern(f"voltage_{phase}"),
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l1_l2 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="voltage_l2_l3",
-        translation_key="voltage_l2_l3",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l2_l3 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="voltage_l3_l1",
-        translation_key="voltage_l3_l1",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_voltage.l3_l1 / 10,
-    ),
+        value_fn=attrgetter(f"ems_voltage.{phase}_v"),
+    )
+    for phase in ("l1", "l2", "l3", "l1_l2", "l2_l3", "l3_l1")
 )
 
 
@@ -319,34 +253,17 @@ VOLTAGE_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
 # Current sensors
 # ---------------------------------------------------------------------------
 
-CURRENT_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+CURRENT_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = tuple(
     HomevoltSensorEntityDescription(
-        key="current_l1",
-        translation_key="current_l1",
+        key=sys.intern(f"current_{phase}"),
+        translation_key=sys.intern(f"current_{phase}"),
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_current.l1 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="current_l2",
-        translation_key="current_l2",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_current.l2 / 10,
-    ),
-    HomevoltSensorEntityDescription(
-        key="current_l3",
-        translation_key="current_l3",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        suggested_display_precision=1,
-        value_fn=lambda agg: agg.ems_current.l3 / 10,
-    ),
+        value_fn=attrgetter(f"ems_current.{phase}_a"),
+    )
+    for phase in ("l1", "l2", "l3")
 )
 
 
@@ -354,60 +271,60 @@ CURRENT_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
 # BMS sensors (per battery module)
 # ---------------------------------------------------------------------------
 
-BMS_SENSORS: tuple[HomevoltBmsSensorEntityDescription, ...] = (
-    HomevoltBmsSensorEntityDescription(
+BMS_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    HomevoltSensorEntityDescription(
         key="bms_soc",
         translation_key="bms_soc",
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=1,
-        value_fn=lambda bms: bms.soc / 100,
+        value_fn=attrgetter("soc_pct"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_state",
         translation_key="bms_state",
         device_class=SensorDeviceClass.ENUM,
-        value_fn=lambda bms: bms.state_str,
+        value_fn=attrgetter("state_str"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_min_temperature",
         translation_key="bms_min_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
-        value_fn=lambda bms: bms.tmin / 10,
+        value_fn=attrgetter("tmin_c"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_max_temperature",
         translation_key="bms_max_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
-        value_fn=lambda bms: bms.tmax / 10,
+        value_fn=attrgetter("tmax_c"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_cycle_count",
         translation_key="bms_cycle_count",
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement="cycles",
-        value_fn=lambda bms: bms.cycle_count,
+        value_fn=attrgetter("cycle_count"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_energy_available",
         translation_key="bms_energy_available",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-        value_fn=lambda bms: bms.energy_avail,
+        value_fn=attrgetter("energy_avail"),
     ),
-    HomevoltBmsSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="bms_alarm",
         translation_key="bms_alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda bms: ", ".join(bms.alarm_str) if bms.alarm_str else None,
+        value_fn=attrgetter("alarm_str_joined"),
     ),
 )
 
@@ -416,153 +333,112 @@ BMS_SENSORS: tuple[HomevoltBmsSensorEntityDescription, ...] = (
 # CT clamp sensors (per sensor device)
 # ---------------------------------------------------------------------------
 
-CT_SENSORS: tuple[HomevoltCtSensorEntityDescription, ...] = (
-    HomevoltCtSensorEntityDescription(
+def _phase_attr(idx: int, attr: str) -> Callable[[SensorData], float | None]:
+    """Return a CT value_fn reading an attribute of one phase, None if absent."""
+    getter = attrgetter(attr)
+
+    def value_fn(sensor: SensorData) -> float | None:
+        try:
+            return getter(sensor.phase[idx])
+        except IndexError:
+            return None
+
+    return value_fn
+
+
+CT_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    HomevoltSensorEntityDescription(
         key="ct_power",
         translation_key="ct_power",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda s: s.total_power,
+        value_fn=attrgetter("total_power"),
     ),
-    HomevoltCtSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_energy_imported",
         translation_key="ct_energy_imported",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda s: s.energy_imported,
+        value_fn=attrgetter("energy_imported"),
     ),
-    HomevoltCtSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_energy_exported",
         translation_key="ct_energy_exported",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda s: s.energy_exported,
+        value_fn=attrgetter("energy_exported"),
     ),
-    HomevoltCtSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_rssi",
         translation_key="ct_rssi",
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        value_fn=lambda s: s.rssi,
+        value_fn=attrgetter("rssi"),
     ),
-    HomevoltCtSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_pdr",
         translation_key="ct_pdr",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda s: s.pdr,
+        value_fn=attrgetter("pdr"),
     ),
-    HomevoltCtSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_frequency",
         translation_key="ct_frequency",
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         suggested_display_precision=2,
-        value_fn=lambda s: s.frequency,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_voltage_l1",
-        translation_key="ct_voltage_l1",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[0].voltage if len(s.phase) > 0 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_voltage_l2",
-        translation_key="ct_voltage_l2",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[1].voltage if len(s.phase) > 1 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_voltage_l3",
-        translation_key="ct_voltage_l3",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[2].voltage if len(s.phase) > 2 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_current_l1",
-        translation_key="ct_current_l1",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[0].amp if len(s.phase) > 0 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_current_l2",
-        translation_key="ct_current_l2",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[1].amp if len(s.phase) > 1 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_current_l3",
-        translation_key="ct_current_l3",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        suggested_display_precision=1,
-        value_fn=lambda s: s.phase[2].amp if len(s.phase) > 2 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_l1",
-        translation_key="ct_power_l1",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda s: s.phase[0].power if len(s.phase) > 0 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_l2",
-        translation_key="ct_power_l2",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda s: s.phase[1].power if len(s.phase) > 1 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_l3",
-        translation_key="ct_power_l3",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda s: s.phase[2].power if len(s.phase) > 2 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_factor_l1",
-        translation_key="ct_power_factor_l1",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.phase[0].pf if len(s.phase) > 0 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_factor_l2",
-        translation_key="ct_power_factor_l2",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.phase[1].pf if len(s.phase) > 1 else None,
-    ),
-    HomevoltCtSensorEntityDescription(
-        key="ct_power_factor_l3",
-        translation_key="ct_power_factor_l3",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.phase[2].pf if len(s.phase) > 2 else None,
+        value_fn=attrgetter("frequency"),
+    ),
+    *(
+        HomevoltSensorEntityDescription(
+            key=sys.intern(f"ct_voltage_l{idx + 1}"),
+            translation_key=sys.intern(f"ct_voltage_l{idx + 1}"),
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            suggested_display_precision=1,
+            value_fn=_phase_attr(idx, "voltage"),
+        )
+        for idx in range(3)
+    ),
+    *(
+        HomevoltSensorEntityDescription(
+            key=sys.intern(f"ct_current_l{idx + 1}"),
+            translation_key=sys.intern(f"ct_current_l{idx + 1}"),
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            suggested_display_precision=1,
+            value_fn=_phase_attr(idx, "amp"),
+        )
+        for idx in range(3)
+    ),
+    *(
+        HomevoltSensorEntityDescription(
+            key=sys.intern(f"ct_power_l{idx + 1}"),
+            translation_key=sys.intern(f"ct_power_l{idx + 1}"),
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfPower.WATT,
+            value_fn=_phase_attr(idx, "power"),
+        )
+        for idx in range(3)
+    ),
+    *(
+        HomevoltSensorEntityDescription(
+            key=sys.intern(f"ct_power_factor_l{idx + 1}"),
+            translation_key=sys.intern(f"ct_power_factor_l{idx + 1}"),
+            entity_category=EntityCategory.DIAGNOSTIC,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=_phase_attr(idx, "pf"),
+        )
+        for idx in range(3)
     ),
 )
 
@@ -571,17 +447,24 @@ CT_SENSORS: tuple[HomevoltCtSensorEntityDescription, ...] = (
 # CT node sensors (per CT clamp node, from /nodes.json + /node_metrics.json)
 # ---------------------------------------------------------------------------
 
+# Usable 2xAA voltage span (1.8V=0%, 3.0V=100%)
+_CT_BATTERY_SPAN = 3.0 - 1.8
+
+
 def _ct_battery_level(metrics: NodeMetrics | None, _info: NodeInfo | None) -> float | None:
     """Convert 2xAA battery voltage to percentage (3.0V=100%, 1.8V=0%)."""
     if metrics is None:
         return None
-    voltage = metrics.battery_voltage
-    level = round(max(0.0, min(100.0, (voltage - 1.8) / (3.0 - 1.8) * 100.0)), 1)
-    return level
+    pct = (metrics.battery_voltage - 1.8) / _CT_BATTERY_SPAN * 100.0
+    if pct <= 0.0:
+        return 0.0
+    if pct >= 100.0:
+        return 100.0
+    return round(pct, 1)
 
 
-CT_NODE_SENSORS: tuple[HomevoltCtNodeSensorEntityDescription, ...] = (
-    HomevoltCtNodeSensorEntityDescription(
+CT_NODE_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    HomevoltSensorEntityDescription(
         key="ct_battery_level",
         translation_key="ct_battery_level",
         device_class=SensorDeviceClass.BATTERY,
@@ -590,7 +473,7 @@ CT_NODE_SENSORS: tuple[HomevoltCtNodeSensorEntityDescription, ...] = (
         suggested_display_precision=0,
         value_fn=_ct_battery_level,
     ),
-    HomevoltCtNodeSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_battery_voltage",
         translation_key="ct_battery_voltage",
         device_class=SensorDeviceClass.VOLTAGE,
@@ -600,7 +483,7 @@ CT_NODE_SENSORS: tuple[HomevoltCtNodeSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda m, n: m.battery_voltage if m is not None else None,
     ),
-    HomevoltCtNodeSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_temperature",
         translation_key="ct_temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -610,7 +493,7 @@ CT_NODE_SENSORS: tuple[HomevoltCtNodeSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda m, n: m.temperature if m is not None else None,
     ),
-    HomevoltCtNodeSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_node_uptime",
         translation_key="ct_node_uptime",
         device_class=SensorDeviceClass.DURATION,
@@ -619,13 +502,13 @@ CT_NODE_SENSORS: tuple[HomevoltCtNodeSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda m, n: m.node_uptime if m is not None else None,
     ),
-    HomevoltCtNodeSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_firmware",
         translation_key="ct_firmware",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda m, n: n.version if n is not None else None,
     ),
-    HomevoltCtNodeSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="ct_ota_status",
         translation_key="ct_ota_status",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -643,24 +526,16 @@ def _find_current_entry(schedule: ScheduleData | None) -> ScheduleEntry | None:
     """Find the schedule entry that covers the current time."""
     if schedule is None or not schedule.entries:
         return None
-    now = int(datetime.now(tz=timezone.utc).timestamp())
-    for entry in schedule.entries:
-        if entry.from_ts <= now < entry.to_ts:
-            return entry
-    return None
+    now = int(time())
+    return schedule.entries_at(now)[0]
 
 
 def _find_next_entry(schedule: ScheduleData | None) -> ScheduleEntry | None:
     """Find the next future schedule entry with a different action."""
     if schedule is None or not schedule.entries:
         return None
-    now = int(datetime.now(tz=timezone.utc).timestamp())
-    current = _find_current_entry(schedule)
-    for entry in schedule.entries:
-        if entry.from_ts >= now:
-            if current is None or entry.type != current.type or entry.setpoint != current.setpoint:
-                return entry
-    return None
+    now = int(time())
+    return schedule.entries_at(now)[1]
 
 
 def _schedule_current_action(schedule: ScheduleData | None) -> str | None:
@@ -682,17 +557,9 @@ def _schedule_current_attrs(schedule: ScheduleData | None) -> dict[str, Any] | N
     if entry is not None:
         attrs["type"] = entry.type
         attrs["setpoint"] = entry.setpoint
-        attrs["from"] = datetime.fromtimestamp(entry.from_ts, tz=timezone.utc).isoformat()
-        attrs["to"] = datetime.fromtimestamp(entry.to_ts, tz=timezone.utc).isoformat()
-    attrs["schedule"] = [
-        {
-            "from": datetime.fromtimestamp(e.from_ts, tz=timezone.utc).isoformat(),
-            "to": datetime.fromtimestamp(e.to_ts, tz=timezone.utc).isoformat(),
-            "type": e.type_name,
-            "setpoint": e.setpoint,
-        }
-        for e in schedule.entries
-    ]
+        attrs["from"] = entry.from_iso
+        attrs["to"] = entry.to_iso
+    attrs["schedule"] = schedule.entry_attrs
     return attrs
 
 
@@ -701,23 +568,23 @@ def _schedule_next_action(schedule: ScheduleData | None) -> str | None:
     entry = _find_next_entry(schedule)
     if entry is None:
         return None
-    time_str = datetime.fromtimestamp(entry.from_ts, tz=timezone.utc).strftime("%H:%M")
+    time_str = datetime.fromtimestamp(entry.from_ts, tz=UTC).strftime("%H:%M")
     return f"{entry.type_name} at {time_str}"
 
 
-SCHEDULE_SENSORS: tuple[HomevoltScheduleSensorEntityDescription, ...] = (
-    HomevoltScheduleSensorEntityDescription(
+SCHEDULE_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    HomevoltSensorEntityDescription(
         key="schedule_current_action",
         translation_key="schedule_current_action",
         value_fn=_schedule_current_action,
         attr_fn=_schedule_current_attrs,
     ),
-    HomevoltScheduleSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="schedule_next_action",
         translation_key="schedule_next_action",
         value_fn=_schedule_next_action,
     ),
-    HomevoltScheduleSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="schedule_entry_count",
         translation_key="schedule_entry_count",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -736,26 +603,26 @@ DIAGNOSTIC_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
         key="ems_info",
         translation_key="ems_info",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda agg: ", ".join(agg.ems_data.info_str) if agg.ems_data.info_str else None,
+        value_fn=attrgetter("ems_data.info_str_joined"),
     ),
     HomevoltSensorEntityDescription(
         key="ems_warning",
         translation_key="ems_warning",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda agg: ", ".join(agg.ems_data.warning_str) if agg.ems_data.warning_str else None,
+        value_fn=attrgetter("ems_data.warning_str_joined"),
     ),
     HomevoltSensorEntityDescription(
         key="ems_alarm",
         translation_key="ems_alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda agg: ", ".join(agg.ems_data.alarm_str) if agg.ems_data.alarm_str else None,
+        value_fn=attrgetter("ems_data.alarm_str_joined"),
     ),
     HomevoltSensorEntityDescription(
         key="error_count",
         translation_key="error_count",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda agg: agg.error_cnt,
+        value_fn=attrgetter("error_cnt"),
     ),
     HomevoltSensorEntityDescription(
         key="ems_error",
@@ -765,40 +632,45 @@ DIAGNOSTIC_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
     ),
 )
 
+# Every description read from the aggregated EMS device
+ALL_SYSTEM_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    SYSTEM_SENSORS + VOLTAGE_SENSORS + CURRENT_SENSORS + DIAGNOSTIC_SENSORS
+)
+
 
 # ---------------------------------------------------------------------------
 # Status sensors (EntityCategory.DIAGNOSTIC, from /status.json)
 # ---------------------------------------------------------------------------
 
-STATUS_SENSORS: tuple[HomevoltStatusSensorEntityDescription, ...] = (
-    HomevoltStatusSensorEntityDescription(
+STATUS_SENSORS: tuple[HomevoltSensorEntityDescription, ...] = (
+    HomevoltSensorEntityDescription(
         key="uptime",
         translation_key="uptime",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.SECONDS,
-        value_fn=lambda data: data.status.up_time if data.status is not None else None,
+        value_fn=optional_attr("status.up_time"),
     ),
-    HomevoltStatusSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="wifi_rssi",
         translation_key="wifi_rssi",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        value_fn=lambda data: data.status.wifi_status.rssi if data.status is not None else None,
+        value_fn=optional_attr("status.wifi_status.rssi"),
     ),
-    HomevoltStatusSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="firmware_esp",
         translation_key="firmware_esp",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.status.firmware.esp if data.status is not None else None,
+        value_fn=optional_attr("status.firmware.esp"),
     ),
-    HomevoltStatusSensorEntityDescription(
+    HomevoltSensorEntityDescription(
         key="firmware_efr",
         translation_key="firmware_efr",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.status.firmware.efr if data.status is not None else None,
+        value_fn=optional_attr("status.firmware.efr"),
     ),
 )
 
@@ -807,38 +679,41 @@ STATUS_SENSORS: tuple[HomevoltStatusSensorEntityDescription, ...] = (
 # Error report sensor
 # ---------------------------------------------------------------------------
 
-def _error_report_status(entries: list[ErrorReportEntry]) -> str | None:
-    """Return worst status from error report (ignoring 'unknown')."""
+def _error_report_summary(
+    entries: list[ErrorReportEntry],
+) -> tuple[str | None, dict[str, Any]]:
+    """Return the worst status and the attributes of an error report in one pass."""
+    ok_count = 0
+    warnings: list[dict[str, str]] = []
+    errors: list[dict[str, str]] = []
+    for e in entries:
+        activated = e.activated
+        if activated == "ok":
+            ok_count += 1
+        elif activated == "warning":
+            warnings.append(
+                {"subsystem": e.sub_system_name, "name": e.error_name, "message": e.message}
+            )
+        elif activated == "error":
+            errors.append(
+                {"subsystem": e.sub_system_name, "name": e.error_name, "message": e.message}
+            )
     if not entries:
-        return None
-    statuses = {e.activated for e in entries}
-    if "error" in statuses:
-        return "error"
-    if "warning" in statuses:
-        return "warning"
-    return "ok"
-
-
-def _error_report_attrs(entries: list[ErrorReportEntry]) -> dict[str, Any]:
-    """Return extra attributes for the error report sensor."""
-    ok_count = sum(1 for e in entries if e.activated == "ok")
-    warning_count = sum(1 for e in entries if e.activated == "warning")
-    error_count = sum(1 for e in entries if e.activated == "error")
-    warnings = [
-        {"subsystem": e.sub_system_name, "name": e.error_name, "message": e.message}
-        for e in entries if e.activated == "warning"
-    ]
-    errors = [
-        {"subsystem": e.sub_system_name, "name": e.error_name, "message": e.message}
-        for e in entries if e.activated == "error"
-    ]
-    return {
+        status = None
+    elif errors:
+        status = "error"
+    elif warnings:
+        status = "warning"
+    else:
+        status = "ok"
+    attrs = {
         "ok_count": ok_count,
-        "warning_count": warning_count,
-        "error_count": error_count,
+        "warning_count": len(warnings),
+        "error_count": len(errors),
         "warnings": warnings,
         "errors": errors,
     }
+    return status, attrs
 
 
 ERROR_REPORT_SENSOR_KEY = "error_report_status"
@@ -862,46 +737,42 @@ class HomevoltSystemSensor(HomevoltEntity, SensorEntity):
         """Initialize a system sensor."""
         super().__init__(coordinator, ecu_id)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{ecu_id}_{description.key}"
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        if self.entity_description.value_fn is None:
-            return None
-        return self.entity_description.value_fn(
-            self.coordinator.data.ems.aggregated,
-        )
+        return self._value_fn(self.coordinator.data.ems.aggregated)
 
 
 class HomevoltStatusSensor(HomevoltEntity, SensorEntity):
     """Sensor for status data (from /status.json)."""
 
-    entity_description: HomevoltStatusSensorEntityDescription
+    entity_description: HomevoltSensorEntityDescription
 
     def __init__(
         self,
         coordinator: HomevoltCoordinator,
         ecu_id: str,
-        description: HomevoltStatusSensorEntityDescription,
+        description: HomevoltSensorEntityDescription,
     ) -> None:
         """Initialize a status sensor."""
-        super().__init__(coordinator, ecu_id)
+        super().__init__(coordinator, ecu_id, "status")
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{ecu_id}_{description.key}"
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        if self.entity_description.value_fn is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._value_fn(self.coordinator.data)
 
 
 class HomevoltBmsSensor(HomevoltBmsEntity, SensorEntity):
     """Sensor for per-battery-module (BMS) data."""
 
-    entity_description: HomevoltBmsSensorEntityDescription
+    entity_description: HomevoltSensorEntityDescription
 
     def __init__(
         self,
@@ -909,28 +780,35 @@ class HomevoltBmsSensor(HomevoltBmsEntity, SensorEntity):
         ecu_id: str,
         bms_index: int,
         serial_number: str,
-        description: HomevoltBmsSensorEntityDescription,
+        description: HomevoltSensorEntityDescription,
     ) -> None:
         """Initialize a BMS sensor."""
         super().__init__(coordinator, ecu_id, bms_index, serial_number)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{serial_number}_{description.key}"
+        # Module resolved from the coordinator snapshot it was looked up in
+        self._snapshot: HomevoltData | None = None
+        self._bms: BmsData | None = None
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        bms_list = self.coordinator.data.ems.aggregated.bms_data
-        if self._bms_index >= len(bms_list):
-            return None
-        if self.entity_description.value_fn is None:
+        data = self.coordinator.data
+        if data is not self._snapshot:
+            bms_list = data.ems.aggregated.bms_data
+            idx = self._bms_index
+            self._bms = bms_list[idx] if idx < len(bms_list) else None
+            self._snapshot = data
+        if self._bms is None:
             return None
-        return self.entity_description.value_fn(bms_list[self._bms_index])
+        return self._value_fn(self._bms)
 
 
 class HomevoltCtSensor(HomevoltSensorDeviceEntity, SensorEntity):
     """Sensor for CT clamp sensor data."""
 
-    entity_description: HomevoltCtSensorEntityDescription
+    entity_description: HomevoltSensorEntityDescription
 
     def __init__(
         self,
@@ -939,28 +817,35 @@ class HomevoltCtSensor(HomevoltSensorDeviceEntity, SensorEntity):
         sensor_index: int,
         sensor_type: str,
         euid: str,
-        description: HomevoltCtSensorEntityDescription,
+        description: HomevoltSensorEntityDescription,
     ) -> None:
         """Initialize a CT sensor."""
         super().__init__(coordinator, ecu_id, sensor_index, sensor_type, euid)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{euid}_{description.key}"
+        # Sensor resolved from the coordinator snapshot it was looked up in
+        self._snapshot: HomevoltData | None = None
+        self._sensor: SensorData | None = None
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        sensors = self.coordinator.data.ems.sensors
-        if self._sensor_index >= len(sensors):
-            return None
-        if self.entity_description.value_fn is None:
+        data = self.coordinator.data
+        if data is not self._snapshot:
+            sensors = data.ems.sensors
+            idx = self._sensor_index
+            self._sensor = sensors[idx] if idx < len(sensors) else None
+            self._snapshot = data
+        if self._sensor is None:
             return None
-        return self.entity_description.value_fn(sensors[self._sensor_index])
+        return self._value_fn(self._sensor)
 
 
 class HomevoltCtNodeSensor(HomevoltSensorDeviceEntity, SensorEntity):
     """Sensor for CT clamp node data (battery, temperature, firmware)."""
 
-    entity_description: HomevoltCtNodeSensorEntityDescription
+    entity_description: HomevoltSensorEntityDescription
 
     def __init__(
         self,
@@ -970,56 +855,74 @@ class HomevoltCtNodeSensor(HomevoltSensorDeviceEntity, SensorEntity):
         sensor_type: str,
         euid: str,
         node_id: int,
-        description: HomevoltCtNodeSensorEntityDescription,
+        description: HomevoltSensorEntityDescription,
     ) -> None:
         """Initialize a CT node sensor."""
-        super().__init__(coordinator, ecu_id, sensor_index, sensor_type, euid)
+        super().__init__(
+            coordinator, ecu_id, sensor_index, sensor_type, euid, "nodes"
+        )
         self._node_id = node_id
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{euid}_{description.key}"
+        # Node data resolved from the coordinator snapshot it was looked up in
+        self._snapshot: HomevoltData | None = None
+        self._metrics: NodeMetrics | None = None
+        self._node_info: NodeInfo | None = None
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        if self.entity_description.value_fn is None:
-            return None
-        metrics = self.coordinator.data.node_metrics.get(self._node_id)
-        node_info = next(
-            (n for n in self.coordinator.data.nodes if n.node_id == self._node_id),
-            None,
-        )
-        return self.entity_description.value_fn(metrics, node_info)
+        data = self.coordinator.data
+        if data is not self._snapshot:
+            self._metrics = data.node_metrics.get(self._node_id)
+            self._node_info = data.nodes_by_id.get(self._node_id)
+            self._snapshot = data
+        return self._value_fn(self._metrics, self._node_info)
 
 
 class HomevoltScheduleSensor(HomevoltEntity, SensorEntity):
     """Sensor for schedule data."""
 
-    entity_description: HomevoltScheduleSensorEntityDescription
+    entity_description: HomevoltSensorEntityDescription
 
     def __init__(
         self,
         coordinator: HomevoltCoordinator,
         ecu_id: str,
-        description: HomevoltScheduleSensorEntityDescription,
+        description: HomevoltSensorEntityDescription,
     ) -> None:
         """Initialize a schedule sensor."""
         super().__init__(coordinator, ecu_id)
         self.entity_description = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{ecu_id}_{description.key}"
+        # Attributes built for a schedule and the slot that was current then
+        self._attrs_schedule: ScheduleData | None = None
+        self._attrs_entry: ScheduleEntry | None = None
+        self._attrs_cache: dict[str, Any] | None = None
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        if self.entity_description.value_fn is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data.schedule)
+        return self._value_fn(self.coordinator.data.schedule)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
         if self.entity_description.attr_fn is None:
             return None
-        return self.entity_description.attr_fn(self.coordinator.data.schedule)
+        schedule = self.coordinator.data.schedule
+        entry = _find_current_entry(schedule)
+        if (
+            self._attrs_cache is None
+            or schedule is not self._attrs_schedule
+            or entry is not self._attrs_entry
+        ):
+            self._attrs_cache = self.entity_description.attr_fn(schedule)
+            self._attrs_schedule = schedule
+            self._attrs_entry = entry
+        return self._attrs_cache
 
 
 class HomevoltErrorReportSensor(HomevoltEntity, SensorEntity):
@@ -1031,22 +934,33 @@ class HomevoltErrorReportSensor(HomevoltEntity, SensorEntity):
         ecu_id: str,
     ) -> None:
         """Initialize the error report sensor."""
-        super().__init__(coordinator, ecu_id)
+        super().__init__(coordinator, ecu_id, "error_report")
         self._attr_unique_id = f"{ecu_id}_{ERROR_REPORT_SENSOR_KEY}"
         self._attr_translation_key = ERROR_REPORT_SENSOR_KEY
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        # Summary of the error report list it was computed from
+        self._summary_for: list[ErrorReportEntry] | None = None
+        self._summary: tuple[str | None, dict[str, Any]] = (None, {})
+
+    def _error_summary(self) -> tuple[str | None, dict[str, Any]]:
+        """Return the status and attributes, computed once per error report."""
+        entries = self.coordinator.data.error_report
+        if entries is not self._summary_for:
+            self._summary = _error_report_summary(entries)
+            self._summary_for = entries
+        return self._summary
 
     @property
     def native_value(self) -> str | None:
         """Return the worst status across all error report entries."""
-        return _error_report_status(self.coordinator.data.error_report)
+        return self._error_summary()[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return counts and details of warnings/errors."""
         if not self.coordinator.data.error_report:
             return None
-        return _error_report_attrs(self.coordinator.data.error_report)
+        return self._error_summary()[1]
 
 
 # ---------------------------------------------------------------------------
@@ -1060,64 +974,71 @@ async def async_setup_entry(
 ) -> None:
     """Set up Homevolt sensor entities from a config entry."""
     coordinator: HomevoltCoordinator = entry.runtime_data
-    data = coordinator.data
-    entities: list[SensorEntity] = []
+    ems = coordinator.data.ems
 
     # Determine the ECU ID from the first EMS device in the list
-    ems_list = data.ems.ems
+    ems_list = ems.ems
     if not ems_list:
         _LOGGER.error("No EMS devices found in Homevolt data")
         return
 
-    ecu_id = str(ems_list[0].ecu_id)
-
-    # --- System sensors (aggregated EMS + voltage + current) ---
-    all_system_descs = SYSTEM_SENSORS + VOLTAGE_SENSORS + CURRENT_SENSORS + DIAGNOSTIC_SENSORS
-    for desc in all_system_descs:
-        entities.append(HomevoltSystemSensor(coordinator, ecu_id, desc))
-
-    # --- Status sensors ---
-    for desc in STATUS_SENSORS:
-        entities.append(HomevoltStatusSensor(coordinator, ecu_id, desc))
-
-    # --- Error report sensor ---
-    entities.append(HomevoltErrorReportSensor(coordinator, ecu_id))
-
-    # --- Schedule sensors ---
-    for desc in SCHEDULE_SENSORS:
-        entities.append(HomevoltScheduleSensor(coordinator, ecu_id, desc))
-
-    # --- BMS sensors (per battery module) ---
-    aggregated = data.ems.aggregated
-    for bms_idx, bms_info in enumerate(aggregated.bms_info):
-        serial = bms_info.serial_number
-        if not serial:
-            serial = f"{ecu_id}_bms_{bms_idx}"
-        for desc in BMS_SENSORS:
-            entities.append(
-                HomevoltBmsSensor(coordinator, ecu_id, bms_idx, serial, desc)
-            )
+    ecu_id = ems_list[0].ecu_id
 
-    # --- CT clamp sensors (skip unconfigured/offline clamps) ---
-    for sensor_idx, sensor_data in enumerate(data.ems.sensors):
-        euid = sensor_data.euid
-        sensor_type = sensor_data.type
-        if not euid or euid == "0000000000000000":
-            continue
-        for desc in CT_SENSORS:
-            entities.append(
-                HomevoltCtSensor(
-                    coordinator, ecu_id, sensor_idx, sensor_type, euid, desc
-                )
+    # Battery modules, falling back to a positional id when the serial is blank
+    bms_modules = [
+        (bms_idx, bms_info.serial_number or f"{ecu_id}_bms_{bms_idx}")
+        for bms_idx, bms_info in enumerate(ems.aggregated.bms_info)
+    ]
+
+    # Configured CT clamps only (unconfigured slots have an all-zero EUID)
+    active_cts = [
+        (sensor_idx, sensor_data)
+        for sensor_idx, sensor_data in enumerate(ems.sensors)
+        if sensor_data.euid and sensor_data.euid != UNCONFIGURED_EUID
+    ]
+
+    entities: list[SensorEntity] = [
+        # --- System sensors (aggregated EMS + voltage + current) ---
+        *(
+            HomevoltSystemSensor(coordinator, ecu_id, desc)
+            for desc in ALL_SYSTEM_SENSORS
+        ),
+        # --- Status sensors ---
+        *(
+            HomevoltStatusSensor(coordinator, ecu_id, desc)
+            for desc in STATUS_SENSORS
+        ),
+        # --- Error report sensor ---
+        HomevoltErrorReportSensor(coordinator, ecu_id),
+        # --- Schedule sensors ---
+        *(
+            HomevoltScheduleSensor(coordinator, ecu_id, desc)
+            for desc in SCHEDULE_SENSORS
+        ),
+        # --- BMS sensors (per battery module) ---
+        *(
+            HomevoltBmsSensor(coordinator, ecu_id, bms_idx, serial, desc)
+            for bms_idx, serial in bms_modules
+            for desc in BMS_SENSORS
+        ),
+        # --- CT clamp sensors ---
+        *(
+            HomevoltCtSensor(
+                coordinator, ecu_id, sensor_idx, sensor_data.type, sensor_data.euid, desc
             )
-        # CT node sensors (battery voltage, temperature, firmware, etc.)
-        if sensor_data.node_id:
-            for desc in CT_NODE_SENSORS:
-                entities.append(
-                    HomevoltCtNodeSensor(
-                        coordinator, ecu_id, sensor_idx, sensor_type, euid,
-                        sensor_data.node_id, desc,
-                    )
-                )
+            for sensor_idx, sensor_data in active_cts
+            for desc in CT_SENSORS
+        ),
+        # --- CT node sensors (battery voltage, temperature, firmware, etc.) ---
+        *(
+            HomevoltCtNodeSensor(
+                coordinator, ecu_id, sensor_idx, sensor_data.type, sensor_data.euid,
+                sensor_data.node_id, desc,
+            )
+            for sensor_idx, sensor_data in active_cts
+            if sensor_data.node_id
+            for desc in CT_NODE_SENSORS
+        ),
+    ]
 
     async_add_entities(entities)
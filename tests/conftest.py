@@ -296,6 +296,7 @@ def _ensure_ha_stubs() -> None:
                 self.config_entry = config_entry
                 self.update_interval = update_interval
                 self.data = None
+                self.last_update_success = True
                 self._listeners: dict = {}
 
             async def async_config_entry_first_refresh(self) -> None:
@@ -312,6 +313,11 @@ def _ensure_ha_stubs() -> None:
                 """Override in subclass."""
                 return None
 
+            def async_update_listeners(self) -> None:
+                """Call every registered listener, like the real coordinator."""
+                for update_callback, _ in list(self._listeners.values()):
+                    update_callback()
+
             def __class_getitem__(cls, item):
                 return cls
 
@@ -324,8 +330,9 @@ def _ensure_ha_stubs() -> None:
 
             has_entity_name = False
 
-            def __init__(self, coordinator):
+            def __init__(self, coordinator, context=None):
                 self.coordinator = coordinator
+                self.coordinator_context = context
 
             def __class_getitem__(cls, item):
                 return cls
@@ -342,8 +349,45 @@ def _ensure_ha_stubs() -> None:
         ha_aiohttp.async_get_clientsession = MagicMock(  # type: ignore[attr-defined]
             return_value=MagicMock()
         )
+    if not hasattr(ha_aiohttp, "async_create_clientsession"):
+        ha_aiohttp.async_create_clientsession = MagicMock(  # type: ignore[attr-defined]
+            return_value=MagicMock()
+        )
     sys.modules["homeassistant.helpers.aiohttp_client"] = ha_aiohttp
 
+    # --- homeassistant.helpers.storage ---
+    ha_storage = sys.modules.get(
+        "homeassistant.helpers.storage"
+    ) or ModuleType("homeassistant.helpers.storage")
+    if not hasattr(ha_storage, "Store"):
+
+        class _StubStore:
+            """In-memory stand-in for Store; delayed saves are written at once."""
+
+            def __init__(self, hass, version, key):
+                self.hass = hass
+                self.version = version
+                self.key = key
+                self.data = None
+
+            async def async_load(self):
+                return self.data
+
+            async def async_save(self, data):
+                self.data = data
+
+            def async_delay_save(self, data_func, delay=0):
+                self.data = data_func()
+
+            async def async_remove(self):
+                self.data = None
+
+            def __class_getitem__(cls, item):
+                return cls
+
+        ha_storage.Store = _StubStore  # type: ignore[attr-defined]
+    sys.modules["homeassistant.helpers.storage"] = ha_storage
+
     # --- homeassistant.helpers.device_registry ---
     ha_devreg = sys.modules.get(
         "homeassistant.helpers.device_registry"
@@ -15,13 +15,16 @@ aiohttp = pytest.importorskip("aiohttp")
 pytest.importorskip("aioresponses")
 
 import pytest_asyncio  # noqa: E402
-from aioresponses import aioresponses  # noqa: E402
+from aioresponses import CallbackResult, aioresponses  # noqa: E402
 
 from custom_components.homevolt.api import (  # noqa: E402
+    BACKOFF_BASE,
+    MAX_BACKOFF,
     HomevoltApiClient,
     HomevoltApiError,
     HomevoltAuthError,
     HomevoltConnectionError,
+    _backoff_delay,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -141,6 +144,16 @@ async def test_retry_exhausted_raises(api_client):
             assert mock_sleep.call_count == 2
 
 
+def test_backoff_delay_is_jittered_and_capped():
+    """Backoff delays are drawn from [0, min(MAX_BACKOFF, BACKOFF_BASE * 2**n)]."""
+    with patch("custom_components.homevolt.api.random.uniform") as mock_uniform:
+        _backoff_delay(1)
+        mock_uniform.assert_called_once_with(0, BACKOFF_BASE * 2)
+        mock_uniform.reset_mock()
+        _backoff_delay(10)
+        mock_uniform.assert_called_once_with(0, MAX_BACKOFF)
+
+
 @pytest.mark.asyncio
 async def test_connection_error(api_client):
     """Test connection error raises HomevoltConnectionError."""
@@ -219,3 +232,255 @@ async def test_base_url_construction():
 async def test_host_property(api_client):
     """Test host property returns the configured host."""
     assert api_client.host == "192.168.70.12"
+
+
+@pytest.mark.asyncio
+async def test_not_modified_returns_previous_result(api_client, ems_fixture):
+    """A 304 reply reuses the previously parsed object and sends the ETag."""
+    url = "http://192.168.70.12:80/ems.json"
+    with aioresponses() as m:
+        m.get(url, payload=ems_fixture, headers={"ETag": '"abc"'})
+        m.get(url, status=304)
+        first = await api_client.async_get_ems_data()
+        second = await api_client.async_get_ems_data()
+
+    assert second is first
+    request = m.requests[("GET", aiohttp.client.URL(url))][1]
+    assert request.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+@pytest.mark.asyncio
+async def test_not_modified_since_returns_previous_result(api_client, status_fixture):
+    """Last-Modified is echoed as If-Modified-Since and a 304 reuses the result."""
+    url = "http://192.168.70.12:80/status.json"
+    stamp = "Wed, 14 Oct 2026 10:00:00 GMT"
+    with aioresponses() as m:
+        m.get(url, payload=status_fixture, headers={"Last-Modified": stamp})
+        m.get(url, status=304)
+        first = await api_client.async_get_status()
+        second = await api_client.async_get_status()
+
+    assert second is first
+    request = m.requests[("GET", aiohttp.client.URL(url))][1]
+    assert request.kwargs["headers"] == {"If-Modified-Since": stamp}
+
+
+@pytest.mark.asyncio
+async def test_get_all_collects_results_and_errors(
+    api_client, ems_fixture, status_fixture
+):
+    """async_get_all fetches concurrently and returns per-endpoint errors."""
+    with aioresponses() as m:
+        m.get("http://192.168.70.12:80/ems.json", payload=ems_fixture)
+        m.get("http://192.168.70.12:80/status.json", payload=status_fixture)
+        m.get("http://192.168.70.12:80/error_report.json", status=401)
+        results = await api_client.async_get_all(
+            ["ems", "status", "error_report"]
+        )
+
+    assert results["ems"].type == "ems_data"
+    assert results["status"].up_time == 308028358
+    assert isinstance(results["error_report"], HomevoltAuthError)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch(api_client, ems_fixture):
+    """Concurrent callers for the same endpoint share a single request."""
+
+    async def slow_reply(url, **kwargs):
+        await asyncio.sleep(0)
+        return CallbackResult(payload=ems_fixture)
+
+    with aioresponses() as m:
+        m.get("http://192.168.70.12:80/ems.json", callback=slow_reply)
+        first, second = await asyncio.gather(
+            api_client.async_get_ems_data(),
+            api_client.async_get_ems_data(),
+        )
+        m.assert_called_once()
+
+    assert first is second
+    assert api_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_errors(api_client):
+    """A failure is propagated to every caller sharing the request."""
+
+    async def slow_reply(url, **kwargs):
+        await asyncio.sleep(0)
+        return CallbackResult(status=401)
+
+    with aioresponses() as m:
+        m.get("http://192.168.70.12:80/ems.json", callback=slow_reply)
+        results = await asyncio.gather(
+            api_client.async_get_ems_data(),
+            api_client.async_get_ems_data(),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, HomevoltAuthError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch(
+    api_client, ems_fixture
+):
+    """Cancelling one caller leaves the shared request running for the rest."""
+    release = asyncio.Event()
+
+    async def slow_reply(url, **kwargs):
+        await release.wait()
+        return CallbackResult(payload=ems_fixture)
+
+    with aioresponses() as m:
+        m.get("http://192.168.70.12:80/ems.json", callback=slow_reply)
+        first = asyncio.create_task(api_client.async_get_ems_data())
+        second = asyncio.create_task(api_client.async_get_ems_data())
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await second
+        m.assert_called_once()
+
+    assert first.cancelled()
+    assert result.type == "ems_data"
+    assert api_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_shared_fetch_cancelled_when_all_callers_cancel(api_client):
+    """The shared request is cancelled once no caller is waiting for it."""
+    release = asyncio.Event()
+
+    async def slow_reply(url, **kwargs):
+        await release.wait()
+        return CallbackResult(status=200)
+
+    with aioresponses() as m:
+        m.get("http://192.168.70.12:80/ems.json", callback=slow_reply)
+        caller = asyncio.create_task(api_client.async_get_ems_data())
+        await asyncio.sleep(0.01)
+        shared = api_client._inflight["/ems.json"].task
+
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await shared
+
+    assert api_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_ping_uses_head(api_client):
+    """async_ping issues a HEAD request and returns True on success."""
+    with aioresponses() as m:
+        m.head("http://192.168.70.12:80/ems.json", status=200)
+        assert await api_client.async_ping() is True
+        m.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ping_auth_error(api_client):
+    """async_ping raises HomevoltAuthError on 401."""
+    with aioresponses() as m:
+        m.head("http://192.168.70.12:80/ems.json", status=401)
+        with pytest.raises(HomevoltAuthError):
+            await api_client.async_ping()
+
+
+@pytest.mark.asyncio
+async def test_ping_falls_back_to_get(api_client, ems_fixture):
+    """async_ping falls back to GET when HEAD is not supported."""
+    with aioresponses() as m:
+        m.head("http://192.168.70.12:80/ems.json", status=405)
+        m.get("http://192.168.70.12:80/ems.json", payload=ems_fixture)
+        assert await api_client.async_ping() is True
+
+
+@pytest.mark.asyncio
+async def test_ping_falls_back_to_get_on_unrouted_head(api_client, ems_fixture):
+    """Any non-auth HEAD failure, such as a 404, is rechecked with a GET."""
+    with aioresponses() as m:
+        m.head("http://192.168.70.12:80/ems.json", status=404)
+        m.get("http://192.168.70.12:80/ems.json", payload=ems_fixture)
+        assert await api_client.async_ping() is True
+
+
+@pytest.mark.asyncio
+async def test_ping_failed_get_is_connection_error(api_client):
+    """A device that also fails the GET is reported as unreachable."""
+    with aioresponses() as m:
+        m.head("http://192.168.70.12:80/ems.json", status=404)
+        m.get("http://192.168.70.12:80/ems.json", status=404)
+        with pytest.raises(HomevoltConnectionError):
+            await api_client.async_ping()
+
+
+@pytest.mark.asyncio
+async def test_ping_connection_error(api_client):
+    """async_ping raises HomevoltConnectionError when unreachable."""
+    with aioresponses() as m:
+        m.head(
+            "http://192.168.70.12:80/ems.json",
+            exception=aiohttp.ClientConnectionError("refused"),
+        )
+        with pytest.raises(HomevoltConnectionError):
+            await api_client.async_ping()
+
+
+@pytest.mark.asyncio
+async def test_stale_result_served_within_ttl(mock_session, ems_fixture):
+    """A failed fetch returns the last good result flagged as stale."""
+    client = HomevoltApiClient(
+        session=mock_session, host="192.168.70.12", stale_ttl=150
+    )
+    url = "http://192.168.70.12:80/ems.json"
+    with aioresponses() as m, patch(
+        "custom_components.homevolt.api.asyncio.sleep", AsyncMock()
+    ):
+        m.get(url, payload=ems_fixture)
+        for _ in range(3):
+            m.get(url, status=503)
+        first = await client.async_get_ems_data()
+        second = await client.async_get_ems_data()
+
+    # A flagged copy: the cached object is shared with earlier snapshots
+    assert second is not first
+    assert second.is_stale is True
+    assert first.is_stale is False
+    assert second.sensors is first.sensors
+
+
+@pytest.mark.asyncio
+async def test_stale_result_not_served_without_ttl(api_client, ems_fixture):
+    """Without a stale TTL a failed fetch raises as before."""
+    url = "http://192.168.70.12:80/ems.json"
+    with aioresponses() as m, patch(
+        "custom_components.homevolt.api.asyncio.sleep", AsyncMock()
+    ):
+        m.get(url, payload=ems_fixture)
+        for _ in range(3):
+            m.get(url, status=503)
+        first = await api_client.async_get_ems_data()
+        assert first.is_stale is False
+        with pytest.raises(HomevoltApiError):
+            await api_client.async_get_ems_data()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_skips_parsing(api_client, ems_fixture):
+    """An identical body returns the previously parsed object."""
+    url = "http://192.168.70.12:80/ems.json"
+    with aioresponses() as m:
+        m.get(url, payload=ems_fixture)
+        m.get(url, payload=ems_fixture)
+        m.get(url, payload={**ems_fixture, "ts": 1})
+        first = await api_client.async_get_ems_data()
+        second = await api_client.async_get_ems_data()
+        third = await api_client.async_get_ems_data()
+
+    assert second is first
+    assert third is not first
+    assert third.ts == 1
@@ -26,6 +26,7 @@ from custom_components.homevolt.binary_sensor import (
     HomevoltCtBinarySensor,
     HomevoltCtNodeBinarySensor,
 )
+from custom_components.homevolt.entity import optional_attr
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -99,6 +100,17 @@ class TestCtAvailableBinarySensor:
         sensor = HomevoltCtBinarySensor(coord, ECU_ID, 99, "grid", "fake", desc)
         assert sensor.is_on is None
 
+    def test_ct_available_follows_new_snapshot(self):
+        """The cached sensor lookup is refreshed when the coordinator data changes."""
+        coord = _make_coordinator_with_data()
+        desc = next(d for d in CT_BINARY_SENSORS if d.key == "ct_available")
+        sensor = HomevoltCtBinarySensor(coord, ECU_ID, 2, "unspecified", "x", desc)
+        assert sensor.is_on is False
+
+        coord.data = _make_coordinator_with_data().data
+        coord.data.ems.sensors[2].available = True
+        assert sensor.is_on is True
+
     def test_ct_available_unique_id(self):
         coord = _make_coordinator_with_data()
         desc = next(d for d in CT_BINARY_SENSORS if d.key == "ct_available")
@@ -185,6 +197,16 @@ class TestSystemBinarySensors:
         sensor = HomevoltBinarySensor(coord, ECU_ID, desc)
         assert sensor._attr_unique_id == f"{ECU_ID}_schedule_local_mode"
 
+    def test_unknown_attribute_is_not_masked(self):
+        """Only a missing parent reads as None; a bad attribute path raises."""
+        coord = _make_coordinator_with_data()
+        getter = optional_attr("status.wifi_status.no_such_field")
+        with pytest.raises(AttributeError):
+            getter(coord.data)
+
+        coord.data.status = None
+        assert getter(coord.data) is None
+
 
 # ---------------------------------------------------------------------------
 # CT node binary sensor tests
@@ -134,6 +134,7 @@ async def test_user_step_success_no_password(flow, ems_response):
     assert result["data"]["password"] is None
     assert result["data"]["port"] == DEFAULT_PORT
     assert result["options"]["scan_interval"] == DEFAULT_SCAN_INTERVAL
+    assert result["options"]["adaptive_polling"] is True
 
 
 @pytest.mark.asyncio
@@ -664,7 +665,7 @@ async def test_reconfigure_updates_entry(reconfigure_flow):
         "custom_components.homevolt.config_flow.HomevoltApiClient",
     ) as mock_client_cls:
         mock_client = MagicMock()
-        mock_client.async_validate_connection = AsyncMock(return_value=None)
+        mock_client.async_ping = AsyncMock(return_value=True)
         mock_client_cls.return_value = mock_client
 
         result = await reconfigure_flow.async_step_reconfigure(
@@ -693,7 +694,7 @@ async def test_reconfigure_updates_without_password(reconfigure_flow):
         "custom_components.homevolt.config_flow.HomevoltApiClient",
     ) as mock_client_cls:
         mock_client = MagicMock()
-        mock_client.async_validate_connection = AsyncMock(return_value=None)
+        mock_client.async_ping = AsyncMock(return_value=True)
         mock_client_cls.return_value = mock_client
 
         result = await reconfigure_flow.async_step_reconfigure(
@@ -724,7 +725,7 @@ async def test_reconfigure_invalid_auth(reconfigure_flow):
         "custom_components.homevolt.config_flow.HomevoltApiClient",
     ) as mock_client_cls:
         mock_client = MagicMock()
-        mock_client.async_validate_connection = AsyncMock(
+        mock_client.async_ping = AsyncMock(
             side_effect=HomevoltAuthError("Bad password")
         )
         mock_client_cls.return_value = mock_client
@@ -752,7 +753,7 @@ async def test_reconfigure_connection_error(reconfigure_flow):
         "custom_components.homevolt.config_flow.HomevoltApiClient",
     ) as mock_client_cls:
         mock_client = MagicMock()
-        mock_client.async_validate_connection = AsyncMock(
+        mock_client.async_ping = AsyncMock(
             side_effect=HomevoltConnectionError("Timeout")
         )
         mock_client_cls.return_value = mock_client
@@ -780,7 +781,7 @@ async def test_reconfigure_unknown_error(reconfigure_flow):
         "custom_components.homevolt.config_flow.HomevoltApiClient",
     ) as mock_client_cls:
         mock_client = MagicMock()
-        mock_client.async_validate_connection = AsyncMock(
+        mock_client.async_ping = AsyncMock(
             side_effect=RuntimeError("Something broke")
         )
         mock_client_cls.return_value = mock_client
@@ -791,3 +792,31 @@ async def test_reconfigure_unknown_error(reconfigure_flow):
 
     assert result["type"] == "form"
     assert result["errors"] == {"base": "unknown"}
+
+
+# ---------------------------------------------------------------------------
+# Tests: Client reuse between steps
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_user_step_retry_reuses_client(flow, ems_response):
+    """Retrying with the same settings reuses the client from the first try."""
+    with patch(
+        "custom_components.homevolt.config_flow.async_get_clientsession",
+        return_value=MagicMock(),
+    ), patch(
+        "custom_components.homevolt.config_flow.HomevoltApiClient",
+    ) as mock_client_cls:
+        mock_client = MagicMock()
+        mock_client.async_validate_connection = AsyncMock(
+            side_effect=[HomevoltConnectionError("Timeout"), ems_response]
+        )
+        mock_client_cls.return_value = mock_client
+
+        first = await flow.async_step_user(user_input={"host": "192.168.70.12"})
+        second = await flow.async_step_user(user_input={"host": "192.168.70.12"})
+
+    assert first["errors"] == {"base": "cannot_connect"}
+    assert second["type"] == "create_entry"
+    mock_client_cls.assert_called_once()
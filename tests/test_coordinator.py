@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -15,6 +17,11 @@ from custom_components.homevolt.api import (
     HomevoltAuthError,
     HomevoltConnectionError,
 )
+from custom_components.homevolt.const import (
+    NODE_METRICS_CONCURRENCY,
+    POLL_JITTER,
+    STATUS_POLL_INTERVAL,
+)
 from custom_components.homevolt.coordinator import HomevoltCoordinator
 from custom_components.homevolt.models import (
     ErrorReportEntry,
@@ -97,6 +104,7 @@ def mock_client(
         side_effect=lambda node_id: node_metrics_responses[node_id]
     )
     client.async_get_schedule = AsyncMock(return_value=schedule_response)
+    client.async_get_all = partial(HomevoltApiClient.async_get_all, client)
     return client
 
 
@@ -127,6 +135,28 @@ def coordinator(mock_hass, mock_config_entry, mock_client) -> HomevoltCoordinato
     )
 
 
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """Drive the coordinator's monotonic clock by hand, with jitter disabled."""
+    now = [0.0]
+    monkeypatch.setattr(
+        "custom_components.homevolt.coordinator.monotonic", lambda: now[0]
+    )
+    monkeypatch.setattr(
+        "custom_components.homevolt.coordinator.random.uniform", lambda a, b: 0.0
+    )
+    return now
+
+
+async def _run_cycles(
+    coordinator: HomevoltCoordinator, clock: list[float], cycles: int
+) -> None:
+    """Run refresh cycles 30 seconds apart."""
+    for _ in range(cycles):
+        coordinator.data = await coordinator._async_update_data()
+        clock[0] += 30
+
+
 # ---------------------------------------------------------------------------
 # Tests: First fetch behaviour
 # ---------------------------------------------------------------------------
@@ -192,7 +222,7 @@ async def test_second_fetch_only_gets_ems(coordinator, mock_client):
 
     mock_client.reset_mock()
 
-    # Second fetch: poll_count=2, not divisible by 4 or 10
+    # Second fetch: no slow tier is due yet
     result = await coordinator._async_update_data()
 
     mock_client.async_get_ems_data.assert_called_once()
@@ -215,35 +245,30 @@ async def test_ems_fetched_every_cycle(coordinator, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_error_report_refreshed_every_4th_cycle(coordinator, mock_client):
-    """Error report should be fetched on the 1st (None), 4th, and 8th cycles."""
-    for i in range(8):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+async def test_error_report_refreshed_every_2_minutes(coordinator, mock_client, clock):
+    """Error report should be fetched at t=0 and t=120s within 4 minutes."""
+    await _run_cycles(coordinator, clock, 8)
 
-    # Poll counts: 1 (None->fetch), 2(skip), 3(skip), 4(fetch), 5(skip), 6(skip), 7(skip), 8(fetch)
-    assert mock_client.async_get_error_report.call_count == 3
+    # Cycles at 0, 30, ..., 210s: fetches at 0 and 120
+    assert mock_client.async_get_error_report.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_status_refreshed_every_10th_cycle(coordinator, mock_client):
-    """Status should be fetched on the 1st (None) and 10th cycles."""
-    for i in range(10):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+async def test_status_refreshed_every_5_minutes(coordinator, mock_client, clock):
+    """Status should be fetched at t=0 and again once 5 minutes have passed."""
+    await _run_cycles(coordinator, clock, 10)
+    assert mock_client.async_get_status.call_count == 1
 
-    # Poll counts: 1 (None->fetch), 10(fetch)
+    await _run_cycles(coordinator, clock, 1)
     assert mock_client.async_get_status.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_status_refreshed_at_20th_cycle(coordinator, mock_client):
-    """Status should be fetched again at the 20th cycle."""
-    for i in range(20):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+async def test_status_refreshed_at_10_minutes(coordinator, mock_client, clock):
+    """Status should be fetched again at t=600s."""
+    await _run_cycles(coordinator, clock, 21)
 
-    # Poll counts: 1 (None->fetch), 10(fetch), 20(fetch) = 3
+    # Fetches at 0, 300 and 600s
     assert mock_client.async_get_status.call_count == 3
 
 
@@ -266,19 +291,29 @@ async def test_cached_data_carried_forward(coordinator, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_poll_count_increments_correctly(coordinator):
-    """Verify _poll_count increments by 1 on each call."""
-    assert coordinator._poll_count == 0
+async def test_tier_deadlines_set_after_fetch(coordinator, clock):
+    """Each fetched tier is next due one interval later."""
+    assert set(coordinator._next_due.values()) == {0.0}
 
+    clock[0] = 1000.0
     await coordinator._async_update_data()
-    assert coordinator._poll_count == 1
-    coordinator.data = HomevoltData()
 
-    await coordinator._async_update_data()
-    assert coordinator._poll_count == 2
+    assert coordinator._next_due["status"] == 1000.0 + STATUS_POLL_INTERVAL
+    assert coordinator._next_due["error_report"] == 1120.0
 
+
+@pytest.mark.asyncio
+async def test_tier_deadlines_are_jittered(coordinator, monkeypatch):
+    """Deadlines stay within the jitter band around the nominal interval."""
+    monkeypatch.setattr(
+        "custom_components.homevolt.coordinator.monotonic", lambda: 0.0
+    )
     await coordinator._async_update_data()
-    assert coordinator._poll_count == 3
+
+    for tier in ("status", "nodes", "schedule"):
+        due = coordinator._next_due[tier]
+        assert STATUS_POLL_INTERVAL * (1 - POLL_JITTER) <= due
+        assert due <= STATUS_POLL_INTERVAL * (1 + POLL_JITTER)
 
 
 # ---------------------------------------------------------------------------
@@ -318,16 +353,32 @@ async def test_auth_error_on_status_triggers_config_entry_auth_failed(
 
 
 @pytest.mark.asyncio
-async def test_connection_error_on_error_report_triggers_update_failed(
+async def test_connection_error_on_error_report_is_non_fatal(
     coordinator, mock_client
 ):
-    """Connection error during error_report fetch should trigger UpdateFailed."""
+    """Connection error during error_report fetch should not fail the refresh."""
     mock_client.async_get_error_report.side_effect = HomevoltConnectionError(
         "Timeout"
     )
 
-    with pytest.raises(UpdateFailed, match="Error communicating with Homevolt"):
-        await coordinator._async_update_data()
+    result = await coordinator._async_update_data()
+
+    assert result.error_report == []
+    assert result.status is not None
+
+
+@pytest.mark.asyncio
+async def test_status_failure_preserves_cached(coordinator, mock_client, clock):
+    """A failed status fetch keeps the last known status."""
+    await _run_cycles(coordinator, clock, 1)
+    original_status = coordinator.data.status
+
+    clock[0] = STATUS_POLL_INTERVAL
+    mock_client.async_get_status.side_effect = HomevoltConnectionError("Timeout")
+    result = await coordinator._async_update_data()
+
+    assert result.status is original_status
+    assert coordinator._next_due["status"] <= clock[0]
 
 
 @pytest.mark.asyncio
@@ -367,7 +418,7 @@ def test_coordinator_init_defaults(mock_hass, mock_config_entry, mock_client):
         client=mock_client,
     )
     assert coord.client is mock_client
-    assert coord._poll_count == 0
+    assert set(coord._next_due) == {"status", "error_report", "nodes", "schedule"}
     assert coord.update_interval == timedelta(seconds=30)
     assert coord.name == "Homevolt"
 
@@ -383,27 +434,91 @@ def test_coordinator_custom_scan_interval(mock_hass, mock_config_entry, mock_cli
     assert coord.update_interval == timedelta(seconds=60)
 
 
+# ---------------------------------------------------------------------------
+# Tests: Adaptive polling
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_backs_off_while_unchanged(coordinator):
+    """Unchanged EMS data doubles the interval up to the cap."""
+    coordinator.data = await coordinator._async_update_data()
+
+    intervals = []
+    for _ in range(5):
+        coordinator.data = await coordinator._async_update_data()
+        intervals.append(coordinator.update_interval.total_seconds())
+
+    assert intervals == [60, 120, 240, 240, 240]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_resets_on_change(coordinator, mock_client):
+    """A change in EMS data restores the configured interval."""
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    changed = _load_fixture("ems_response.json")
+    changed["aggregated"]["ems_data"]["power"] += 100
+    mock_client.async_get_ems_data.return_value = HomevoltEmsResponse.from_dict(
+        changed
+    )
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_ignores_timestamps(coordinator, mock_client):
+    """A response that only advances its timestamps counts as unchanged."""
+    coordinator.data = await coordinator._async_update_data()
+
+    for offset in (1, 2):
+        payload = _load_fixture("ems_response.json")
+        payload["ts"] += offset
+        payload["aggregated"]["ems_data"]["timestamp_ms"] += offset * 1000
+        mock_client.async_get_ems_data.return_value = HomevoltEmsResponse.from_dict(
+            payload
+        )
+        coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_polling_disabled(mock_hass, mock_config_entry, mock_client):
+    """With adaptive polling off the interval never changes."""
+    coord = HomevoltCoordinator(
+        hass=mock_hass,
+        config_entry=mock_config_entry,
+        client=mock_client,
+        adaptive_polling=False,
+    )
+    for _ in range(3):
+        coord.data = await coord._async_update_data()
+
+    assert coord.update_interval == timedelta(seconds=30)
+
+
 # ---------------------------------------------------------------------------
 # Tests: Combined tiered polling scenario
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.asyncio
-async def test_full_polling_scenario(coordinator, mock_client):
-    """Run through 12 cycles and verify the exact call counts.
+async def test_full_polling_scenario(coordinator, mock_client, clock):
+    """Run through 12 cycles 30s apart and verify the exact call counts.
 
-    Expected fetch pattern (1-indexed poll_count):
+    Expected fetch pattern (seconds since the first refresh):
         EMS:           every cycle                 -> 12 calls
-        status:        cycle 1(None), 10           -> 2 calls
-        error_report:  cycle 1(None), 4, 8, 12     -> 4 calls
+        status:        0, 300                      -> 2 calls
+        error_report:  0, 120, 240                 -> 3 calls
     """
-    for i in range(12):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+    await _run_cycles(coordinator, clock, 12)
 
     assert mock_client.async_get_ems_data.call_count == 12
     assert mock_client.async_get_status.call_count == 2
-    assert mock_client.async_get_error_report.call_count == 4
+    assert mock_client.async_get_error_report.call_count == 3
 
 
 # ---------------------------------------------------------------------------
@@ -426,11 +541,40 @@ async def test_first_fetch_gets_nodes_and_metrics(coordinator, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_nodes_polled_every_10th_cycle(coordinator, mock_client):
-    """Nodes should be fetched on cycle 1 (None) and 10."""
-    for i in range(10):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+async def test_node_metrics_fetch_is_bounded(coordinator, mock_client):
+    """Node metrics are fetched concurrently, at most N at a time."""
+    active = peak = 0
+
+    async def fetch(node_id):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return NodeMetrics(node_id=node_id)
+
+    mock_client.async_get_node_metrics = AsyncMock(side_effect=fetch)
+    result = await coordinator._async_fetch_node_metrics(list(range(1, 9)))
+
+    assert sorted(result) == list(range(1, 9))
+    assert 1 < peak <= NODE_METRICS_CONCURRENCY
+
+
+def test_configured_node_ids_cached_by_layout(coordinator, ems_response):
+    """CT node ids are recomputed only when the sensor layout changes."""
+    sensors = ems_response.sensors
+    node_ids = coordinator._configured_node_ids(sensors)
+    assert node_ids == (2, 3)
+    assert coordinator._configured_node_ids(list(sensors)) is node_ids
+
+    sensors[0].euid = "0000000000000000"
+    assert coordinator._configured_node_ids(sensors) == (3,)
+
+
+@pytest.mark.asyncio
+async def test_nodes_polled_every_5_minutes(coordinator, mock_client, clock):
+    """Nodes should be fetched at t=0 and t=300s."""
+    await _run_cycles(coordinator, clock, 11)
 
     assert mock_client.async_get_nodes.call_count == 2
 
@@ -557,11 +701,9 @@ async def test_first_fetch_gets_schedule(coordinator, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_schedule_polled_every_10th_cycle(coordinator, mock_client):
-    """Schedule should be fetched on cycle 1 (None) and 10."""
-    for i in range(10):
-        result = await coordinator._async_update_data()
-        coordinator.data = result
+async def test_schedule_polled_every_5_minutes(coordinator, mock_client, clock):
+    """Schedule should be fetched at t=0 and t=300s."""
+    await _run_cycles(coordinator, clock, 11)
 
     assert mock_client.async_get_schedule.call_count == 2
 
@@ -601,8 +743,166 @@ async def test_schedule_failure_preserves_cached(coordinator, mock_client):
     original_schedule = first_result.schedule
 
     # Force schedule poll on next cycle
-    coordinator._poll_count = 9  # next will be 10 (divisible by 10)
+    coordinator._next_due["schedule"] = 0.0
     mock_client.async_get_schedule.side_effect = Exception("Timeout")
 
     second_result = await coordinator._async_update_data()
     assert second_result.schedule is original_schedule
+
+
+@pytest.mark.asyncio
+async def test_schedule_failure_retried_next_cycle(coordinator, mock_client, clock):
+    """A failed schedule fetch is retried on the next refresh, not in 5 min."""
+    mock_client.async_get_schedule.side_effect = Exception("Timeout")
+    await _run_cycles(coordinator, clock, 1)
+
+    mock_client.async_get_schedule.side_effect = None
+    await _run_cycles(coordinator, clock, 2)
+
+    # Failed at t=0, succeeded at t=30, not due again at t=60
+    assert mock_client.async_get_schedule.call_count == 2
+    assert coordinator.data.schedule is not None
+
+
+# ---------------------------------------------------------------------------
+# Tests: Persisted slow-tier data
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_restore_skips_tiers_not_yet_due(
+    coordinator, mock_hass, mock_config_entry, mock_client, clock
+):
+    """After a restart only EMS is fetched while the saved tiers are fresh."""
+    await _run_cycles(coordinator, clock, 1)
+
+    restarted = HomevoltCoordinator(
+        hass=mock_hass, config_entry=mock_config_entry, client=mock_client
+    )
+    restarted._store.data = coordinator._store.data
+    await restarted.async_restore()
+    mock_client.reset_mock()
+
+    result = await restarted._async_update_data()
+
+    mock_client.async_get_ems_data.assert_called_once()
+    mock_client.async_get_status.assert_not_called()
+    mock_client.async_get_nodes.assert_not_called()
+    mock_client.async_get_schedule.assert_not_called()
+    assert result.status == coordinator.data.status
+    assert result.error_report == coordinator.data.error_report
+    assert result.node_metrics == coordinator.data.node_metrics
+    assert result.schedule == coordinator.data.schedule
+
+
+@pytest.mark.asyncio
+async def test_restore_fetches_expired_tiers(
+    coordinator, mock_hass, mock_config_entry, mock_client, clock
+):
+    """Saved tiers whose deadline passed while stopped are fetched again."""
+    await _run_cycles(coordinator, clock, 1)
+    stored = coordinator._store.data
+    stored["due"] = dict.fromkeys(stored["due"], 0.0)
+
+    restarted = HomevoltCoordinator(
+        hass=mock_hass, config_entry=mock_config_entry, client=mock_client
+    )
+    restarted._store.data = stored
+    await restarted.async_restore()
+    mock_client.reset_mock()
+
+    await restarted._async_update_data()
+
+    mock_client.async_get_status.assert_called_once()
+    mock_client.async_get_schedule.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_restore_tolerates_unknown_stored_fields(
+    coordinator, mock_hass, mock_config_entry, mock_client, clock
+):
+    """Fields a newer or older model does not know are ignored on restore."""
+    await _run_cycles(coordinator, clock, 1)
+    stored = coordinator._store.data
+    for metrics in stored["node_metrics"].values():
+        metrics["node"]["removed_field"] = 1
+
+    restarted = HomevoltCoordinator(
+        hass=mock_hass, config_entry=mock_config_entry, client=mock_client
+    )
+    restarted._store.data = stored
+    await restarted.async_restore()
+
+    assert restarted._restored is not None
+    assert restarted._restored.node_metrics == coordinator.data.node_metrics
+
+
+@pytest.mark.asyncio
+async def test_restore_error_means_no_cached_data(
+    mock_hass, mock_config_entry, mock_client
+):
+    """Stored data that cannot be parsed is treated as empty."""
+    restarted = HomevoltCoordinator(
+        hass=mock_hass, config_entry=mock_config_entry, client=mock_client
+    )
+    restarted._store.async_load = AsyncMock(return_value={"status": []})
+    await restarted.async_restore()
+    assert restarted._restored is None
+
+    # Data saved in an older storage layout is dropped rather than migrated
+    assert await restarted._store._async_migrate_func(1, 1, {"status": {}}) == {}
+
+
+@pytest.mark.asyncio
+async def test_restore_does_not_mask_programming_errors(
+    mock_hass, mock_config_entry, mock_client
+):
+    """Only malformed data is ignored; other errors propagate."""
+    restarted = HomevoltCoordinator(
+        hass=mock_hass, config_entry=mock_config_entry, client=mock_client
+    )
+    restarted._store.async_load = AsyncMock(side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        await restarted.async_restore()
+
+
+# ---------------------------------------------------------------------------
+# Tests: Tier-scoped listener updates
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_listeners_only_woken_for_changed_tiers(coordinator, clock):
+    """Tier-bound listeners skip refreshes where their tier did not change."""
+    calls: list[str | None] = []
+    for context in (None, "status", "nodes"):
+        cb = partial(calls.append, context)
+        coordinator._listeners[cb] = (cb, context)
+
+    await _run_cycles(coordinator, clock, 1)
+    coordinator.async_update_listeners()
+    assert calls == [None, "status", "nodes"]
+
+    calls.clear()
+    await _run_cycles(coordinator, clock, 1)
+    coordinator.async_update_listeners()
+    assert calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_listeners_all_woken_after_failed_refresh(coordinator, clock):
+    """After a failed refresh the next one updates every listener."""
+    calls: list[str | None] = []
+    cb = partial(calls.append, "status")
+    coordinator._listeners[cb] = (cb, "status")
+    await _run_cycles(coordinator, clock, 1)
+    coordinator.async_update_listeners()
+
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    coordinator.last_update_success = True
+    calls.clear()
+    await _run_cycles(coordinator, clock, 1)
+    coordinator.async_update_listeners()
+
+    assert calls == ["status"]
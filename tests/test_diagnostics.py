@@ -0,0 +1,55 @@
+"""Tests for Homevolt diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.homevolt.diagnostics import async_get_config_entry_diagnostics
+from custom_components.homevolt.models import (
+    ErrorReportEntry,
+    HomevoltData,
+    HomevoltEmsResponse,
+    HomevoltStatusResponse,
+    NodeInfo,
+    NodeMetrics,
+    to_dict,
+)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_match_to_dict(
+    ems_fixture,
+    status_fixture,
+    error_report_fixture,
+    nodes_fixture,
+    node_metrics_2_fixture,
+):
+    """The orjson round trip produces the same shape as models.to_dict."""
+    data = HomevoltData(
+        ems=HomevoltEmsResponse.from_dict(ems_fixture),
+        status=HomevoltStatusResponse.from_dict(status_fixture),
+        error_report=[ErrorReportEntry.from_dict(e) for e in error_report_fixture],
+        nodes=tuple(map(NodeInfo.from_dict, nodes_fixture)),
+        node_metrics={2: NodeMetrics.from_dict(node_metrics_2_fixture)},
+    )
+    entry = MagicMock()
+    entry.data = {"host": "192.168.1.100", "password": "secret"}
+    entry.options = {}
+    entry.runtime_data.data = data
+
+    diag = await async_get_config_entry_diagnostics(MagicMock(), entry)
+
+    assert diag["config"] == {"host": "192.168.1.100", "password": "**REDACTED**"}
+    assert diag["ems"] == to_dict(data.ems)
+    assert diag["error_report"] == to_dict(data.error_report)
+    assert diag["nodes"] == to_dict(data.nodes)
+    assert diag["node_metrics"] == {"2": to_dict(data.node_metrics[2])}
+    # Derived fields are not part of the payload
+    assert "soc_avg_pct" not in diag["ems"]["aggregated"]["ems_data"]
+
+    status = to_dict(data.status)
+    status["wifi_status"]["ssid"] = "**REDACTED**"
+    status["wifi_status"]["ip"] = "**REDACTED**"
+    assert diag["status"] == status
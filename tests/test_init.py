@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,12 +14,14 @@ from custom_components.homevolt.api import (
     HomevoltApiClient,
     HomevoltConnectionError,
 )
+from custom_components.homevolt.const import STALE_TTL_CYCLES
 from custom_components.homevolt.coordinator import HomevoltCoordinator
 from custom_components.homevolt.models import (
     ErrorReportEntry,
     HomevoltData,
     HomevoltEmsResponse,
     HomevoltStatusResponse,
+    NodeMetrics,
 )
 
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -69,6 +72,8 @@ def _make_mock_client(
     client.async_get_error_report = AsyncMock(
         return_value=error_report if error_report is not None else _make_error_report()
     )
+    client.async_get_node_metrics = AsyncMock(return_value=NodeMetrics())
+    client.async_get_all = partial(HomevoltApiClient.async_get_all, client)
     return client
 
 
@@ -108,7 +113,7 @@ async def test_setup_entry_creates_coordinator_and_refreshes():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -137,7 +142,7 @@ async def test_setup_entry_forwards_sensor_platform():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -161,7 +166,7 @@ async def test_setup_entry_registers_update_listener():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -182,7 +187,7 @@ async def test_setup_entry_uses_config_data():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ) as mock_session, patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -206,7 +211,7 @@ async def test_setup_entry_uses_custom_scan_interval():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -219,6 +224,35 @@ async def test_setup_entry_uses_custom_scan_interval():
     assert coordinator.update_interval == timedelta(seconds=60)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("options", "stale_ttl"),
+    [
+        ({"scan_interval": 30, "adaptive_polling": False}, 30 * STALE_TTL_CYCLES),
+        ({"scan_interval": 30}, 240 * STALE_TTL_CYCLES),
+        ({"scan_interval": 10}, 80 * STALE_TTL_CYCLES),
+        ({"scan_interval": 60}, 300 * STALE_TTL_CYCLES),
+    ],
+)
+async def test_setup_entry_stale_ttl_covers_longest_interval(options, stale_ttl):
+    """The stale TTL spans the longest interval polling can back off to."""
+    hass = _make_hass()
+    entry = _make_config_entry()
+    entry.options = options
+    mock_client = _make_mock_client()
+
+    with patch(
+        "custom_components.homevolt.async_create_clientsession",
+        return_value=MagicMock(),
+    ), patch(
+        "custom_components.homevolt.HomevoltApiClient",
+        return_value=mock_client,
+    ) as mock_client_cls:
+        await async_setup_entry(hass, entry)
+
+    assert mock_client_cls.call_args.kwargs["stale_ttl"] == stale_ttl
+
+
 # ---------------------------------------------------------------------------
 # Tests: async_unload_entry
 # ---------------------------------------------------------------------------
@@ -270,7 +304,7 @@ async def test_setup_then_unload_lifecycle():
     mock_client = _make_mock_client()
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -302,7 +336,7 @@ async def test_setup_entry_raises_not_ready_on_connection_error():
     )
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -324,7 +358,7 @@ async def test_setup_entry_not_ready_does_not_store_coordinator():
     )
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -349,7 +383,7 @@ async def test_setup_entry_not_ready_does_not_forward_platforms():
     )
 
     with patch(
-        "custom_components.homevolt.async_get_clientsession",
+        "custom_components.homevolt.async_create_clientsession",
         return_value=MagicMock(),
     ), patch(
         "custom_components.homevolt.HomevoltApiClient",
@@ -359,3 +393,29 @@ async def test_setup_entry_not_ready_does_not_forward_platforms():
             await async_setup_entry(hass, entry)
 
     hass.config_entries.async_forward_entry_setups.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: client session
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_uses_managed_session():
+    """The client gets a session created (and closed) by Home Assistant."""
+    hass = _make_hass()
+    entry = _make_config_entry()
+    mock_client = _make_mock_client()
+    session = MagicMock()
+
+    with patch(
+        "custom_components.homevolt.async_create_clientsession",
+        return_value=session,
+    ) as mock_create, patch(
+        "custom_components.homevolt.HomevoltApiClient",
+        return_value=mock_client,
+    ) as mock_client_cls:
+        await async_setup_entry(hass, entry)
+
+    mock_create.assert_called_once_with(hass)
+    assert mock_client_cls.call_args.kwargs["session"] is session
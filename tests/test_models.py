@@ -1,6 +1,7 @@
 """Tests for Homevolt data models."""
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ from custom_components.homevolt.models import (
     HomevoltEmsResponse,
     HomevoltStatusResponse,
     ErrorReportEntry,
+    HomevoltData,
     NodeMetrics,
     NodeInfo,
     ScheduleData,
@@ -26,7 +28,7 @@ def test_parse_ems_response():
     assert response.type == "ems_data"
     assert response.ts > 0
     assert len(response.ems) == 1
-    assert response.aggregated.ecu_id == 0  # aggregated has ecu_id 0
+    assert response.aggregated.ecu_id == "0"  # aggregated has ecu_id 0
     assert response.aggregated.ems_info.rated_capacity == 13304
     assert response.aggregated.ems_info.rated_power == 6000
     assert response.aggregated.ems_info.fw_version == "v31.4"
@@ -37,7 +39,7 @@ def test_parse_ems_device():
     data = json.loads((FIXTURES / "ems_response.json").read_text())
     device = HomevoltEmsResponse.from_dict(data).ems[0]
 
-    assert device.ecu_id == 9731192375880
+    assert device.ecu_id == "9731192375880"
     assert device.op_state_str == "idle"
     assert device.error_str == "No error"
     assert len(device.bms_info) == 2
@@ -121,6 +123,8 @@ def test_parse_ems_data_fields():
     assert "EMS_INFO_CONNECTED_TO_BACKEND" in ems_data.info_str
     assert "EMS_WARNING_UNDER_SOC_MIN_WARNING" in ems_data.warning_str
     assert ems_data.alarm_str == []
+    assert "EMS_INFO_CONNECTED_TO_BACKEND" in ems_data.info_str_joined
+    assert ems_data.alarm_str_joined is None
     assert ems_data.frequency == 49969  # centi-Hz
     assert ems_data.energy_produced == 3777576  # Wh
     assert ems_data.energy_consumed == 4290436  # Wh
@@ -298,6 +302,54 @@ def test_parse_node_info_empty():
     assert node.manifest_version == ""
 
 
+def test_parse_missing_lists_are_not_shared():
+    """Missing list fields get a fresh default per parsed instance."""
+    first = ErrorReportEntry.from_dict({})
+    second = ErrorReportEntry.from_dict({})
+
+    assert first.details == []
+    assert first.details is not second.details
+
+
+def test_parse_read_only_sequences_as_tuples():
+    """BMS modules and CT sensors parse to tuples, empty when missing."""
+    data = json.loads((FIXTURES / "ems_response.json").read_text())
+    response = HomevoltEmsResponse.from_dict(data)
+
+    assert isinstance(response.sensors, tuple)
+    assert isinstance(response.aggregated.bms_data, tuple)
+    assert HomevoltEmsResponse.from_dict({}).sensors == ()
+
+
+def test_state_strings_are_interned():
+    """Low-cardinality state strings from separate parses share one object."""
+    data = json.loads((FIXTURES / "ems_response.json").read_text())
+    first = HomevoltEmsResponse.from_dict(data).aggregated.ems_data
+    second = HomevoltEmsResponse.from_dict(
+        json.loads((FIXTURES / "ems_response.json").read_text())
+    ).aggregated.ems_data
+
+    assert first.state_str is second.state_str
+
+
+def test_error_report_activation_is_interned():
+    """Activation states are interned, so comparisons match by identity."""
+    data = json.loads((FIXTURES / "error_report_response.json").read_text())
+    entries = [ErrorReportEntry.from_dict(e) for e in data]
+
+    error = sys.intern("error")
+    assert any(e.activated is error for e in entries)
+
+
+def test_models_use_slots():
+    """Parsed models carry no per-instance __dict__."""
+    data = json.loads((FIXTURES / "ems_response.json").read_text())
+    response = HomevoltEmsResponse.from_dict(data)
+
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(response.sensors[0].phase[0], "__dict__")
+
+
 # ---------------------------------------------------------------------------
 # Schedule model tests
 # ---------------------------------------------------------------------------
@@ -336,6 +388,19 @@ def test_parse_schedule_entry_fields():
     assert entry.to_ts == 1739674800
     assert entry.setpoint == 17250
     assert entry.main_fuse == 25000
+    assert entry.from_iso == "2025-02-16T01:00:00+00:00"
+    assert entry.to_iso == "2025-02-16T03:00:00+00:00"
+
+
+def test_parse_schedule_entry_bad_timestamp():
+    """An unrepresentable timestamp blanks that bound instead of failing the parse."""
+    schedule = ScheduleData.from_dict(
+        {"entries": [{"id": 0, "from_ts": 10**20, "to_ts": 1739674800}]}
+    )
+    entry = schedule.entries[0]
+
+    assert entry.from_iso == ""
+    assert entry.to_iso == "2025-02-16T03:00:00+00:00"
 
 
 def test_parse_schedule_empty():
@@ -364,3 +429,43 @@ def test_schedule_entry_unknown_type():
     """Test ScheduleEntry returns descriptive string for unknown types."""
     entry = ScheduleEntry.from_dict({"type": 99})
     assert entry.type_name == "Unknown (99)"
+
+
+def test_schedule_entries_at_memoized_per_second():
+    """entries_at scans once per timestamp and rescans when time moves on."""
+    data = json.loads((FIXTURES / "schedule_response.json").read_text())
+    schedule = ScheduleData.from_dict(data)
+
+    current, upcoming = schedule.entries_at(1739670000)
+    assert current is schedule.entries[1]
+    assert upcoming is not None and upcoming.from_ts >= 1739670000
+
+    schedule.entries[1].type = 0  # a cached lookup does not rescan
+    assert schedule.entries_at(1739670000)[0] is current
+
+    assert schedule.entries_at(1739660000)[0] is None
+
+
+def test_nodes_by_id_tracks_node_list():
+    """nodes_by_id indexes nodes and is rebuilt when the list is replaced."""
+    data = json.loads((FIXTURES / "nodes_response.json").read_text())
+    combined = HomevoltData(nodes=[NodeInfo.from_dict(n) for n in data])
+
+    assert combined.nodes_by_id[2] is combined.nodes[0]
+    assert combined.nodes_by_id is combined.nodes_by_id
+
+    combined.nodes = [NodeInfo(node_id=7)]
+    assert list(combined.nodes_by_id) == [7]
+
+
+def test_nodes_by_eui_tracks_node_list():
+    """nodes_by_eui indexes nodes by EUI alongside nodes_by_id."""
+    data = json.loads((FIXTURES / "nodes_response.json").read_text())
+    combined = HomevoltData(nodes=[NodeInfo.from_dict(n) for n in data])
+
+    first = combined.nodes[0]
+    assert combined.nodes_by_eui[first.eui] is first
+
+    combined.nodes = [NodeInfo(node_id=7, eui="a"), NodeInfo(node_id=8, eui="a")]
+    assert combined.nodes_by_eui["a"].node_id == 7
+    assert list(combined.nodes_by_id) == [7, 8]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -36,8 +36,7 @@ from custom_components.homevolt.sensor import (
     HomevoltCtNodeSensor,
     HomevoltScheduleSensor,
     HomevoltErrorReportSensor,
-    _error_report_status,
-    _error_report_attrs,
+    _error_report_summary,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -87,7 +86,8 @@ class TestSystemSensors:
     def test_battery_soc(self):
         coord = _make_coordinator_with_data()
         # Override soc_avg to test centi-percent conversion
-        coord.data.ems.aggregated.ems_data.soc_avg = 8590
+        agg = coord.data.ems.aggregated
+        agg.ems_data = replace(agg.ems_data, soc_avg=8590)
         desc = next(d for d in SYSTEM_SENSORS if d.key == "battery_soc")
         sensor = HomevoltSystemSensor(coord, ECU_ID, desc)
         assert sensor.native_value == pytest.approx(85.9)
@@ -128,6 +128,16 @@ class TestSystemSensors:
         sensor = HomevoltSystemSensor(coord, ECU_ID, desc)
         assert sensor.native_value == 90
 
+    def test_device_info_tracks_firmware_version(self):
+        coord = _make_coordinator_with_data()
+        sensor = HomevoltSystemSensor(coord, ECU_ID, SYSTEM_SENSORS[0])
+        assert sensor.device_info["sw_version"] != "2.0.0"
+
+        ems = HomevoltEmsResponse.from_dict(_load_fixture("ems_response.json"))
+        ems.aggregated.ems_info.fw_version = "2.0.0"
+        coord.data = HomevoltData(ems=ems)
+        assert sensor.device_info["sw_version"] == "2.0.0"
+
     def test_unique_id_format(self):
         coord = _make_coordinator_with_data()
         desc = next(d for d in SYSTEM_SENSORS if d.key == "battery_soc")
@@ -181,7 +191,9 @@ class TestBmsSensors:
     def test_bms_soc_module_0(self):
         coord = _make_coordinator_with_data()
         # Override soc to test centi-percent conversion
-        coord.data.ems.aggregated.bms_data[0].soc = 5830
+        aggregated = coord.data.ems.aggregated
+        bms_data = aggregated.bms_data
+        aggregated.bms_data = (replace(bms_data[0], soc=5830), *bms_data[1:])
         desc = next(d for d in BMS_SENSORS if d.key == "bms_soc")
         serial = "80000274099724441432"
         sensor = HomevoltBmsSensor(coord, ECU_ID, 0, serial, desc)
@@ -473,6 +485,18 @@ class TestCtNodeSensors:
         sensor = HomevoltCtNodeSensor(coord, ECU_ID, 0, "grid", euid, 99, desc)
         assert sensor.native_value is None
 
+    def test_ct_node_follows_new_snapshot(self):
+        """The cached node lookup is refreshed when the coordinator data changes."""
+        coord = _make_coordinator_with_data()
+        desc = next(d for d in CT_NODE_SENSORS if d.key == "ct_battery_voltage")
+        euid = "a46dd4fffea23d6a"
+        sensor = HomevoltCtNodeSensor(coord, ECU_ID, 0, "grid", euid, 2, desc)
+        assert sensor.native_value is not None
+
+        coord.data = _make_coordinator_with_data().data
+        coord.data.node_metrics.clear()
+        assert sensor.native_value is None
+
     def test_ct_node_unique_id(self):
         coord = _make_coordinator_with_data()
         desc = next(d for d in CT_NODE_SENSORS if d.key == "ct_battery_voltage")
@@ -650,7 +674,8 @@ class TestErrorReportSensor:
             ErrorReportEntry(activated="ok"),
             ErrorReportEntry(activated="unknown"),
         ]
-        assert _error_report_status(entries) == "ok"
+        status, _attrs = _error_report_summary(entries)
+        assert status == "ok"
 
     def test_helper_error_report_attrs_counts(self):
         """Test attr helper with mixed statuses."""
@@ -660,7 +685,8 @@ class TestErrorReportSensor:
             ErrorReportEntry(sub_system_name="C", error_name="c1", activated="error", message="err msg"),
             ErrorReportEntry(sub_system_name="D", error_name="d1", activated="unknown", message="unk"),
         ]
-        attrs = _error_report_attrs(entries)
+        status, attrs = _error_report_summary(entries)
+        assert status == "error"
         assert attrs["ok_count"] == 1
         assert attrs["warning_count"] == 1
         assert attrs["error_count"] == 1
@@ -754,11 +780,7 @@ class TestScheduleSensors:
         sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
 
         # Entry 1: from_ts=1739667600 to_ts=1739674800, type=3 (Grid Charge), setpoint=17250
-        mock_now = datetime.fromtimestamp(1739670000, tz=timezone.utc)
-        with patch("custom_components.homevolt.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_now
-            mock_dt.fromtimestamp = datetime.fromtimestamp
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with patch("custom_components.homevolt.sensor.time", return_value=1739670000):
             assert sensor.native_value == "Grid Charge (17250 W)"
 
     def test_schedule_current_action_during_idle(self):
@@ -768,11 +790,7 @@ class TestScheduleSensors:
         sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
 
         # Entry 0: from_ts=1739664000 to_ts=1739667600, type=0 (Idle)
-        mock_now = datetime.fromtimestamp(1739665000, tz=timezone.utc)
-        with patch("custom_components.homevolt.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_now
-            mock_dt.fromtimestamp = datetime.fromtimestamp
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with patch("custom_components.homevolt.sensor.time", return_value=1739665000):
             assert sensor.native_value == "Idle"
 
     def test_schedule_current_action_no_match(self):
@@ -782,11 +800,7 @@ class TestScheduleSensors:
         sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
 
         # Before all entries
-        mock_now = datetime.fromtimestamp(1739660000, tz=timezone.utc)
-        with patch("custom_components.homevolt.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_now
-            mock_dt.fromtimestamp = datetime.fromtimestamp
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with patch("custom_components.homevolt.sensor.time", return_value=1739660000):
             assert sensor.native_value is None
 
     def test_schedule_next_action_from_idle(self):
@@ -796,11 +810,7 @@ class TestScheduleSensors:
         sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
 
         # During entry 0 (idle), next should be entry 1 (grid charge)
-        mock_now = datetime.fromtimestamp(1739665000, tz=timezone.utc)
-        with patch("custom_components.homevolt.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_now
-            mock_dt.fromtimestamp = datetime.fromtimestamp
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with patch("custom_components.homevolt.sensor.time", return_value=1739665000):
             value = sensor.native_value
             assert value is not None
             assert "Grid Charge" in value
@@ -819,11 +829,7 @@ class TestScheduleSensors:
         desc = next(d for d in SCHEDULE_SENSORS if d.key == "schedule_current_action")
         sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
 
-        mock_now = datetime.fromtimestamp(1739670000, tz=timezone.utc)
-        with patch("custom_components.homevolt.sensor.datetime") as mock_dt:
-            mock_dt.now.return_value = mock_now
-            mock_dt.fromtimestamp = datetime.fromtimestamp
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with patch("custom_components.homevolt.sensor.time", return_value=1739670000):
             attrs = sensor.extra_state_attributes
             assert attrs is not None
             assert attrs["schedule_id"] == "tibber_schedule_2026-02-16T00:00:00Z"
@@ -834,6 +840,19 @@ class TestScheduleSensors:
             assert "schedule" in attrs
             assert len(attrs["schedule"]) == 6
 
+    def test_schedule_current_action_attrs_cached_per_slot(self):
+        """Attributes are reused within a slot and rebuilt when the slot changes."""
+        coord = _make_coordinator_with_data()
+        desc = next(d for d in SCHEDULE_SENSORS if d.key == "schedule_current_action")
+        sensor = HomevoltScheduleSensor(coord, ECU_ID, desc)
+
+        with patch("custom_components.homevolt.sensor.time", return_value=1739670000):
+            attrs = sensor.extra_state_attributes
+        with patch("custom_components.homevolt.sensor.time", return_value=1739670060):
+            assert sensor.extra_state_attributes is attrs
+        with patch("custom_components.homevolt.sensor.time", return_value=1739665000):
+            assert sensor.extra_state_attributes["type"] == 0
+
     def test_schedule_current_action_attrs_none_schedule(self):
         """When schedule is None, attrs returns None."""
         coord = _make_coordinator_with_data()